@@ -10,7 +10,7 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from .geometry_detector import GeometryInfo
 
-@dataclass
+@dataclass(slots=True)
 class DefGenerationOptions:
     """Options for .def file generation"""
     normalize_to_hp150: bool = False  # Usar geometría real por defecto
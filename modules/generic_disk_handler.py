@@ -10,7 +10,7 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from .enhanced_format_detector import EnhancedFormatDetector, DiskFormat
 
-@dataclass
+@dataclass(slots=True)
 class FileEntry:
     name: str
     ext: str
@@ -16,7 +16,7 @@ from enum import Enum
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # TD0Reader and TD0Decompressor will be passed as parameters to avoid circular imports
 
-@dataclass
+@dataclass(slots=True)
 class GeometryInfo:
     """Detected disk geometry information"""
     type: str = "unknown"
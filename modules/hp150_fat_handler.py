@@ -6,8 +6,11 @@ Compatible with the modular disk handler architecture
 
 import struct
 import os
+import logging
+import mmap
 import tempfile
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 # Import the common FileEntry from the existing modules
@@ -15,7 +18,7 @@ try:
     from .generic_disk_handler import FileEntry
 except ImportError:
     # Fallback definition for standalone use
-    @dataclass
+    @dataclass(slots=True)
     class FileEntry:
         name: str
         ext: str
@@ -37,14 +40,37 @@ except ImportError:
         def is_volume(self) -> bool:
             return bool(self.attr & 0x08)
 
+logger = logging.getLogger(__name__)
+
+# 32-byte FAT directory entry: name, ext, attr, reserved/time/date, cluster, size
+_DIR_ENTRY = struct.Struct('<8s3sB14xHL')
+
+# Directory probes stop counting once a candidate is clearly valid
+_DIR_PROBE_LIMIT = 8
+
+# Control characters, DEL and non-ASCII bytes are dropped from filenames
+_NAME_DELETE = bytes(range(0x20)) + bytes(range(0x7F, 0x100))
+
 class HP150FATHandler:
     """Specialized FAT handler for HP150 disk images with non-standard sector sizes and offsets"""
     
     def __init__(self, image_path: str, root_dir_offset: Optional[int] = None):
         self.image_path = image_path
         self.file_handle = open(image_path, 'rb')
+        # Read-only view of the whole image for cluster chain reads; mmap
+        # refuses empty files, which read as empty bytes instead
+        try:
+            if os.fstat(self.file_handle.fileno()).st_size:
+                self._mm = mmap.mmap(self.file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._mm = b''
+        except Exception:
+            self.file_handle.close()
+            raise
         self.volume_label = None
         self._files = {}
+        self._visible_files = []
+        self._used_bytes = 0
         self._fat_table = None
         
         # HP150 specific parameters
@@ -70,7 +96,7 @@ class HP150FATHandler:
     
     def _auto_detect_root_directory(self) -> Optional[int]:
         """Auto-detect HP150 root directory location"""
-        print("[INFO] Auto-detecting HP150 root directory...")
+        logger.info("Auto-detecting HP150 root directory...")
         
         # HP150 common directory offsets (prioritized)
         hp150_offsets = [
@@ -86,26 +112,26 @@ class HP150FATHandler:
         max_entries = 0
         
         for offset in hp150_offsets:
-            if offset >= os.path.getsize(self.image_path):
+            if offset >= len(self._mm):
                 continue
                 
             try:
-                entries = self._count_valid_entries_at_offset(offset)
+                entries = self._count_valid_entries_at_offset(offset, _DIR_PROBE_LIMIT)
                 if entries > max_entries:
                     max_entries = entries
                     best_offset = offset
                     
-                print(f"[DEBUG] Offset 0x{offset:x}: {entries} valid entries")
+                logger.debug("Offset 0x%x: %d valid entries", offset, entries)
                 
             except Exception as e:
-                print(f"[DEBUG] Error checking offset 0x{offset:x}: {e}")
+                logger.debug("Error checking offset 0x%x: %s", offset, e)
                 continue
         
         if best_offset and max_entries >= 3:
-            print(f"[INFO] Found HP150 directory at 0x{best_offset:x} with {max_entries} entries")
+            logger.info("Found HP150 directory at 0x%x with %d entries", best_offset, max_entries)
             return best_offset
         
-        print("[WARN] Could not auto-detect HP150 directory")
+        logger.warning("Could not auto-detect HP150 directory")
         return None
     
     def _calculate_hp150_layout(self):
@@ -126,21 +152,18 @@ class HP150FATHandler:
             
         self.cluster_size = self.sectors_per_cluster * self.bytes_per_sector
         
-        print(f"[INFO] HP150 Layout: root_dir=0x{self.root_dir_offset:x}, data_start=0x{self.data_start:x}, cluster_size={self.cluster_size}")
+        logger.info("HP150 Layout: root_dir=0x%x, data_start=0x%x, cluster_size=%d",
+                    self.root_dir_offset, self.data_start, self.cluster_size)
     
-    def _count_valid_entries_at_offset(self, offset: int) -> int:
-        """Count valid directory entries at given offset"""
+    def _count_valid_entries_at_offset(self, offset: int, limit: Optional[int] = None) -> int:
+        """Count valid directory entries at given offset, stopping early at limit"""
         try:
-            self.file_handle.seek(offset)
-            dir_data = self.file_handle.read(512)  # Read directory data
+            dir_data = self._mm[offset:offset + 512]  # Read directory data
             
             valid_count = 0
-            for i in range(0, len(dir_data), 32):
-                if i + 32 > len(dir_data):
-                    break
-                    
-                entry = dir_data[i:i+32]
-                first_byte = entry[0]
+            usable = len(dir_data) - len(dir_data) % _DIR_ENTRY.size
+            for name_bytes, _, attr, _, _ in _DIR_ENTRY.iter_unpack(dir_data[:usable]):
+                first_byte = name_bytes[0]
                 
                 # End of directory
                 if first_byte == 0:
@@ -156,8 +179,7 @@ class HP150FATHandler:
                 
                 try:
                     # Try to decode filename
-                    name = entry[0:8].decode('ascii', errors='ignore').strip()
-                    attr = entry[11]
+                    name = name_bytes.decode('ascii', errors='ignore').strip()
                     
                     # Check if this looks like a valid entry
                     if (name and 
@@ -165,6 +187,8 @@ class HP150FATHandler:
                         any(c.isalnum() or c in '._-+$' for c in name) and
                         attr < 0x80):
                         valid_count += 1
+                        if limit and valid_count >= limit:
+                            break
                         
                 except:
                     continue
@@ -181,16 +205,12 @@ class HP150FATHandler:
         # Parse FAT12 table
         self._fat_table = []
         for i in range(0, len(fat_data) - 2, 3):  # Ensure we have at least 3 bytes
-            # Read 3 bytes and extract 2 FAT12 entries
-            three_bytes = fat_data[i:i+3]
-            if len(three_bytes) >= 3:
-                # Unpack as 3 bytes + 1 padding byte for uint32
-                val = struct.unpack('<I', three_bytes + b'\x00')[0]
-                entry1 = val & 0xFFF
-                entry2 = (val >> 12) & 0xFFF
-                self._fat_table.extend([entry1, entry2])
-        
-        print(f"[INFO] Loaded FAT12 table with {len(self._fat_table)} entries")
+            # Decode 3 little-endian bytes into 2 FAT12 entries
+            val = fat_data[i] | (fat_data[i+1] << 8) | (fat_data[i+2] << 16)
+            self._fat_table.append(val & 0xFFF)
+            self._fat_table.append(val >> 12)
+        
+        logger.info("Loaded FAT12 table with %d entries", len(self._fat_table))
     
     def _load_directory(self):
         """Load HP150 directory entries"""
@@ -203,12 +223,12 @@ class HP150FATHandler:
         self._files = {}
         entry_count = 0
         
-        for i in range(0, len(root_data), 32):
-            if i + 32 > len(root_data):
-                break
-                
-            entry_data = root_data[i:i+32]
-            first_byte = entry_data[0]
+        usable = len(root_data) - len(root_data) % _DIR_ENTRY.size
+        entries = _DIR_ENTRY.iter_unpack(root_data[:usable])
+        
+        for index, (name_bytes, ext_bytes, attr, cluster, size) in enumerate(entries):
+            i = index * _DIR_ENTRY.size
+            first_byte = name_bytes[0]
             
             # End of directory
             if first_byte == 0x00:
@@ -227,25 +247,6 @@ class HP150FATHandler:
                 continue
             
             try:
-                # Parse entry - ensure we have enough data
-                if len(entry_data) < 32:
-                    continue
-                    
-                name_bytes = entry_data[0:8]
-                ext_bytes = entry_data[8:11]
-                attr = entry_data[11]
-                
-                # Safely extract cluster and size
-                if len(entry_data) >= 28:
-                    cluster = struct.unpack('<H', entry_data[26:28])[0]
-                else:
-                    cluster = 0
-                    
-                if len(entry_data) >= 32:
-                    size = struct.unpack('<L', entry_data[28:32])[0]
-                else:
-                    size = 0
-                
                 # Clean filename
                 name = self._clean_filename(name_bytes)
                 ext = self._clean_filename(ext_bytes)
@@ -257,7 +258,7 @@ class HP150FATHandler:
                 if attr & 0x08:  # Volume label
                     volume_name = f"{name}.{ext}" if ext else name
                     self.volume_label = volume_name.strip()
-                    print(f"[INFO] Found volume label: '{self.volume_label}'")
+                    logger.info("Found volume label: '%s'", self.volume_label)
                     continue
                 
                 # Skip hidden/system files that are clearly HP150 internal
@@ -266,7 +267,7 @@ class HP150FATHandler:
                 
                 # Validate file size (HP150 floppies are small)
                 if size > 2 * 1024 * 1024:  # 2MB max
-                    print(f"[WARN] Skipping {name}.{ext} - size too large: {size}")
+                    logger.warning("Skipping %s.%s - size too large: %d", name, ext, size)
                     continue
                 
                 # Create file entry
@@ -283,31 +284,32 @@ class HP150FATHandler:
                 self._files[file_entry.full_name] = file_entry
                 entry_count += 1
                 
-                print(f"[DEBUG] Entry {entry_count}: {file_entry.full_name} ({file_entry.size} bytes, cluster {file_entry.cluster})")
+                logger.debug("Entry %d: %s (%d bytes, cluster %d)",
+                             entry_count, file_entry.full_name, file_entry.size, file_entry.cluster)
                 
             except Exception as e:
-                print(f"[WARN] Error parsing entry at offset {i}: {e}")
+                logger.warning("Error parsing entry at offset %d: %s", i, e)
                 continue
         
-        print(f"[INFO] Loaded {len(self._files)} files from HP150 directory")
+        # Precompute allocated space and the visible listing once per load
+        cluster_size = self.cluster_size
+        self._used_bytes = sum(
+            (fe.size + cluster_size - 1) // cluster_size * cluster_size
+            for fe in self._files.values() if fe.cluster > 0
+        )
+        self._visible_files = [
+            fe for fe in self._files.values()
+            if not (fe.attr & 0x02 and fe.name.upper() in ('HPSYS', 'HP150SYS'))
+        ]
+        
+        logger.info("Loaded %d files from HP150 directory", len(self._files))
     
     def _clean_filename(self, name_bytes: bytes) -> str:
         """Clean HP150 filename bytes"""
         try:
-            # Decode and clean
-            decoded = name_bytes.decode('ascii', errors='ignore')
-            
-            # Remove padding and invalid characters
-            clean = ''
-            for char in decoded:
-                if char.isprintable() and char not in '\x00\xFF ':
-                    clean += char
-                elif char == ' ':
-                    break  # Space padding
-                elif char == '\x00':
-                    break  # Null terminator
-                    
-            return clean.rstrip()
+            # Stop at null terminator or space padding, then drop invalid bytes
+            name = name_bytes.split(b'\x00', 1)[0].split(b' ', 1)[0]
+            return name.translate(None, _NAME_DELETE).decode('ascii')
         except:
             return ""
     
@@ -317,28 +319,16 @@ class HP150FATHandler:
     
     def list_visible_files(self) -> List[FileEntry]:
         """Return list of visible files (excluding hidden/system)"""
-        visible = []
-        for file_entry in self._files.values():
-            # Skip volume labels
-            if file_entry.is_volume:
-                continue
-            # Include hidden files unless they're clearly system files
-            if file_entry.attr & 0x02 and file_entry.name.upper() in ['HPSYS', 'HP150SYS']:
-                continue
-            visible.append(file_entry)
-        return visible
+        # Volume labels are never stored as files; hidden files are included
+        # unless they're clearly system files (filtered in _load_directory)
+        return list(self._visible_files)
     
     def get_disk_info(self) -> Dict:
         """Return disk information"""
         total_size = self.file_size = os.path.getsize(self.image_path)
         
-        # Calculate used space
-        used_space = 0
-        for file_entry in self._files.values():
-            if not file_entry.is_volume and file_entry.cluster > 0:
-                # Calculate clusters needed
-                clusters_needed = (file_entry.size + self.cluster_size - 1) // self.cluster_size
-                used_space += clusters_needed * self.cluster_size
+        # Used space is accumulated while loading the directory
+        used_space = self._used_bytes
         
         # Add system space (FAT + directory)
         system_space = self.fat_size * self.fat_copies + 512  # FAT + directory space
@@ -376,73 +366,80 @@ class HP150FATHandler:
         elif not os.path.exists(output_dir):
             raise ValueError(f"Output directory '{output_dir}' does not exist")
         
-        extracted_files = {}
+        # Only regular files with allocated data are extracted
+        entries = [
+            fe for fe in self._files.values()
+            if not (fe.is_directory or fe.is_volume) and fe.cluster != 0 and fe.size != 0
+        ]
+        if not entries:
+            return {}
         
-        for file_entry in self._files.values():
-            # Skip directories and volume labels
-            if file_entry.is_directory or file_entry.is_volume:
-                continue
+        # Files are independent and the memory map is stateless, so write concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+            results = executor.map(lambda fe: self._extract_one(fe, output_dir), entries)
+            return {name: path for name, path in results if path}
+    
+    def _extract_one(self, file_entry: FileEntry, output_dir: str) -> Tuple[str, Optional[str]]:
+        """Extract a single file, returning its name and output path (None on error)"""
+        try:
+            # Create output file
+            output_file = os.path.join(output_dir, file_entry.full_name)
             
-            # Skip files with no cluster or size
-            if file_entry.cluster == 0 or file_entry.size == 0:
-                continue
+            # Stream file content one cluster at a time
+            bytes_written = 0
+            with open(output_file, 'wb') as f:
+                for chunk in self._iter_file_content(file_entry):
+                    bytes_written += f.write(chunk)
             
-            try:
-                # Extract file content
-                file_content = self._read_file_content(file_entry)
-                
-                # Create output file
-                output_file = os.path.join(output_dir, file_entry.full_name)
-                
-                with open(output_file, 'wb') as f:
-                    f.write(file_content)
-                
-                extracted_files[file_entry.full_name] = output_file
-                print(f"[INFO] Extracted: {file_entry.full_name} ({len(file_content)} bytes)")
-                
-            except Exception as e:
-                print(f"[WARN] Error extracting {file_entry.full_name}: {e}")
-        
-        return extracted_files
+            logger.info("Extracted: %s (%d bytes)", file_entry.full_name, bytes_written)
+            return file_entry.full_name, output_file
+            
+        except Exception as e:
+            logger.warning("Error extracting %s: %s", file_entry.full_name, e)
+            return file_entry.full_name, None
     
     def _read_file_content(self, file_entry: FileEntry) -> bytes:
         """Read file content following HP150 FAT chain"""
+        return b''.join(self._iter_file_content(file_entry))
+    
+    def _iter_file_content(self, file_entry: FileEntry) -> Iterator[bytes]:
+        """Yield file content cluster by cluster following HP150 FAT chain"""
         if file_entry.cluster == 0 or file_entry.size == 0:
-            return b''
+            return
         
-        content = b''
+        image = self._mm
+        image_size = len(image)
         current_cluster = file_entry.cluster
         bytes_remaining = file_entry.size
         
-        visited_clusters = set()  # Prevent infinite loops
+        fat_table = self._fat_table
+        visited = bytearray(len(fat_table))  # Bitmap to prevent infinite loops
         
         while current_cluster >= 2 and bytes_remaining > 0:
-            # Prevent infinite loops
-            if current_cluster in visited_clusters:
-                print(f"[WARN] Detected loop in cluster chain for {file_entry.full_name}")
-                break
-            visited_clusters.add(current_cluster)
+            # Prevent infinite loops (clusters past the FAT end the chain below)
+            if current_cluster < len(visited):
+                if visited[current_cluster]:
+                    logger.warning("Detected loop in cluster chain for %s", file_entry.full_name)
+                    break
+                visited[current_cluster] = 1
             
             # Calculate cluster position in HP150 layout
             cluster_offset = self.data_start + ((current_cluster - 2) * self.cluster_size)
             
             # Validate cluster offset
-            if cluster_offset >= os.path.getsize(self.image_path):
-                print(f"[WARN] Cluster {current_cluster} offset 0x{cluster_offset:x} beyond file")
+            if cluster_offset >= image_size:
+                logger.warning("Cluster %d offset 0x%x beyond file", current_cluster, cluster_offset)
                 break
             
-            # Read cluster data
-            self.file_handle.seek(cluster_offset)
-            cluster_data = self.file_handle.read(self.cluster_size)
-            
-            # Take only what we need
-            bytes_to_take = min(len(cluster_data), bytes_remaining)
-            content += cluster_data[:bytes_to_take]
+            # Take only what we need from the cluster
+            cluster_end = min(cluster_offset + self.cluster_size, image_size)
+            bytes_to_take = min(cluster_end - cluster_offset, bytes_remaining)
+            yield image[cluster_offset:cluster_offset + bytes_to_take]
             bytes_remaining -= bytes_to_take
             
             # Get next cluster from FAT
-            if current_cluster < len(self._fat_table):
-                next_cluster = self._fat_table[current_cluster]
+            if current_cluster < len(fat_table):
+                next_cluster = fat_table[current_cluster]
                 
                 # Check for end-of-chain markers (FAT12)
                 if next_cluster >= 0xFF8:  # End of chain
@@ -455,25 +452,24 @@ class HP150FATHandler:
                 current_cluster = next_cluster
             else:
                 break
-        
-        return content
     
     def _read_file_clusters(self, start_cluster: int) -> List[int]:
         """Read cluster chain starting from given cluster"""
         if not self._fat_table or start_cluster < 2:
             return []
         
+        fat_table = self._fat_table
         clusters = []
         current = start_cluster
-        visited = set()
+        visited = bytearray(len(fat_table))
         
-        while current >= 2 and current < len(self._fat_table):
-            if current in visited:  # Loop detection
+        while current >= 2 and current < len(fat_table):
+            if visited[current]:  # Loop detection
                 break
-            visited.add(current)
+            visited[current] = 1
             clusters.append(current)
             
-            next_cluster = self._fat_table[current]
+            next_cluster = fat_table[current]
             
             # Check for end-of-chain
             if next_cluster >= 0xFF8:  # FAT12 end-of-chain
@@ -487,7 +483,7 @@ class HP150FATHandler:
             
             # Safety limit
             if len(clusters) > 1000:
-                print(f"[WARN] Cluster chain too long, stopping at {len(clusters)} clusters")
+                logger.warning("Cluster chain too long, stopping at %d clusters", len(clusters))
                 break
         
         return clusters
@@ -512,6 +508,9 @@ class HP150FATHandler:
     
     def close(self):
         """Close file handle"""
+        if self._mm:
+            self._mm.close()
+            self._mm = None
         if self.file_handle:
             self.file_handle.close()
     
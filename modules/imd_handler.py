@@ -7,7 +7,17 @@ import struct
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+# Fill-value sectors shared across tracks, keyed by (value, size)
+_FILL_CACHE: Dict[Tuple[int, int], bytes] = {}
+
+def _fill(value: int, size: int) -> bytes:
+    """Return a cached sector of size bytes all set to value"""
+    data = _FILL_CACHE.get((value, size))
+    if data is None:
+        data = _FILL_CACHE.setdefault((value, size), bytes((value,)) * size)
+    return data
+
+@dataclass(slots=True)
 class IMDTrack:
     mode: int           # 0-5: recording mode
     cylinder: int       # Physical cylinder
@@ -18,7 +28,7 @@ class IMDTrack:
     sector_data: Dict[int, bytes]  # Sector number -> data
     bad_sectors: List[int]  # List of bad/unavailable sector numbers
 
-@dataclass 
+@dataclass(slots=True)
 class IMDImage:
     header: str         # ASCII header with version/date/time
     comment: str        # Comment text
@@ -44,6 +54,8 @@ class IMDHandler:
     def __init__(self, imd_path: str):
         self.imd_path = imd_path
         self.file_handle = None
+        self._buf = b''
+        self._pos = 0
         
     def __enter__(self):
         self.file_handle = open(self.imd_path, 'rb')
@@ -58,10 +70,13 @@ class IMDHandler:
         if not self.file_handle:
             raise ValueError("File not opened")
         
+        # Floppy images are small: parse from one in-memory buffer
         self.file_handle.seek(0)
+        self._buf = self.file_handle.read()
+        self._pos = 0
         
         # Check IMD signature
-        signature = self.file_handle.read(3)
+        signature = self._read_bytes(3)
         if signature != b'IMD':
             raise ValueError("File doesn't start with 'IMD' signature")
         
@@ -80,15 +95,11 @@ class IMDHandler:
     
     def _read_header_and_comment(self) -> Tuple[str, str]:
         """Read ASCII header and comment terminated by 0x1a"""
-        header_comment = b''
-        
-        while True:
-            byte = self.file_handle.read(1)
-            if not byte:
-                break
-            if byte[0] == 0x1a:  # End of comment marker
-                break
-            header_comment += byte
+        end = self._buf.find(0x1a, self._pos)  # End of comment marker
+        if end < 0:
+            end = len(self._buf)
+        header_comment = self._buf[self._pos:end]
+        self._pos = end + 1
         
         # Split header and comment (first line is header)
         try:
@@ -103,11 +114,10 @@ class IMDHandler:
     def _read_track(self) -> Optional[IMDTrack]:
         """Read a single track from the IMD file"""
         # Read track header (5 bytes)
-        mode_byte = self.file_handle.read(1)
-        if not mode_byte:
+        if self._pos >= len(self._buf):
             return None  # EOF
             
-        mode = mode_byte[0]
+        mode = self._read_byte()
         if mode > 6:
             raise ValueError(f"Invalid mode {mode}, stream out of sync")
         
@@ -131,19 +141,15 @@ class IMDHandler:
         sector_size = self.SECTOR_SIZES[sector_size_code]
         
         # Read sector numbering map
-        sector_map = []
-        for i in range(sector_count):
-            sector_map.append(self._read_byte())
+        sector_map = list(self._read_exact(sector_count))
         
         # Read optional cylinder map (if head_flags & 0x40)
         if head_flags & 0x40:
-            for i in range(sector_count):
-                self._read_byte()  # Discard cylinder map
+            self._read_exact(sector_count)  # Discard cylinder map
         
         # Read optional head map (if head_flags & 0x80) 
         if head_flags & 0x80:
-            for i in range(sector_count):
-                self._read_byte()  # Discard head map
+            self._read_exact(sector_count)  # Discard head map
         
         # Read sector data records
         sector_data = {}
@@ -157,7 +163,7 @@ class IMDHandler:
             if data is None:
                 bad_sectors.append(sector_num)
                 # Fill with 0xE5 for bad sectors
-                data = bytes([0xE5] * sector_size)
+                data = _fill(0xE5, sector_size)
             
             sector_data[sector_num] = data
         
@@ -177,34 +183,48 @@ class IMDHandler:
         if data_type == 0:  # Sector data unavailable
             return None
         elif data_type == 1:  # Normal data
-            return self.file_handle.read(sector_size)
+            return self._read_bytes(sector_size)
         elif data_type == 2:  # Compressed - all bytes are same value
             fill_value = self._read_byte()
-            return bytes([fill_value] * sector_size)
+            return _fill(fill_value, sector_size)
         elif data_type == 3:  # Deleted data address mark
-            return self.file_handle.read(sector_size) 
+            return self._read_bytes(sector_size)
         elif data_type == 4:  # Compressed deleted data
             fill_value = self._read_byte()
-            return bytes([fill_value] * sector_size)
+            return _fill(fill_value, sector_size)
         elif data_type == 5:  # Deleted address marks
             return None
         elif data_type == 6:  # Compressed deleted address marks
             fill_value = self._read_byte()
-            return bytes([fill_value] * sector_size)
+            return _fill(fill_value, sector_size)
         elif data_type == 7:  # Bad sector
             return None
         elif data_type == 8:  # Compressed bad sector
             fill_value = self._read_byte()
-            return bytes([fill_value] * sector_size)
+            return _fill(fill_value, sector_size)
         else:
             raise ValueError(f"Unknown sector data type: {data_type}")
     
     def _read_byte(self) -> int:
-        """Read a single byte from file"""
-        byte = self.file_handle.read(1)
-        if not byte:
+        """Read a single byte from the file buffer"""
+        pos = self._pos
+        if pos >= len(self._buf):
+            raise EOFError("Unexpected end of file")
+        self._pos = pos + 1
+        return self._buf[pos]
+    
+    def _read_exact(self, count: int) -> bytes:
+        """Read exactly count bytes from the file buffer"""
+        data = self._read_bytes(count)
+        if len(data) < count:
             raise EOFError("Unexpected end of file")
-        return byte[0]
+        return data
+    
+    def _read_bytes(self, count: int) -> bytes:
+        """Read up to count bytes from the file buffer"""
+        data = self._buf[self._pos:self._pos + count]
+        self._pos += len(data)
+        return data
 
 class IMD2IMGConverter:
     """Converter from IMD to IMG format"""
@@ -224,13 +244,11 @@ class IMD2IMGConverter:
                 print(f"Tracks: {len(imd_image.tracks)}")
             
             # Convert to linear IMG format
-            with open(img_path, 'wb') as img_file:
+            # Large write buffer: tracks are emitted as single joined blocks
+            with open(img_path, 'wb', buffering=1 << 20) as img_file:
                 tracks_written = 0
                 
                 for track in imd_image.tracks:
-                    # Sort sectors to handle skew correctly (key fix from imd2raw.c)
-                    sorted_sectors = sorted(track.sector_map)
-                    
                     if self.verbose:
                         print(f"Cyl {track.cylinder:02d} Hd {track.head} {track.sector_size:4d} ", end="")
                         
@@ -246,13 +264,9 @@ class IMD2IMGConverter:
                             print(f" {sector_num:2d}", end="")
                         print()
                     
-                    # Write sectors in sorted order to handle skew
-                    for sector_num in sorted_sectors:
-                        if sector_num in track.sector_data:
-                            img_file.write(track.sector_data[sector_num])
-                        else:
-                            # Fill missing sectors with 0xE5
-                            img_file.write(bytes([0xE5] * track.sector_size))
+                    # Write sectors in sorted order to handle skew (key fix from imd2raw.c)
+                    sector_data = track.sector_data
+                    img_file.write(b''.join([sector_data[num] for num in sorted(track.sector_map)]))
                     
                     tracks_written += 1
                 
@@ -4,11 +4,176 @@ Raw Disk Image Extractor
 Extracts useful information from unknown/raw disk formats
 """
 
+import io
 import os
+import mmap
+import shutil
 import struct
-from typing import Dict, List, Optional
+import tarfile
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+# Translate table for hex dump sidebars: printable ASCII kept, others shown as '.'
+_ASCII_SIDEBAR = bytes(b if 32 <= b <= 126 else ord('.') for b in range(256))
+
+# Translate table mapping printable ASCII bytes to 1, others to 0
+_PRINTABLE_MASK = bytes(1 if 32 <= b <= 126 else 0 for b in range(256))
+
+# Translate table mapping text bytes (printable ASCII, tab, LF, CR) to 1, others to 0
+_TEXT_MASK = bytes(1 if 32 <= b <= 126 or b in (9, 10, 13) else 0 for b in range(256))
+
+def _find_ascii_runs_numpy(data: bytes, min_len: int):
+    """Return (starts, ends) of printable ASCII runs of min_len+ bytes or touching either edge"""
+    mask = np.frombuffer(data.translate(_PRINTABLE_MASK), dtype=np.int8)
+    edges = np.diff(np.concatenate(([0], mask, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts >= min_len) | (starts == 0) | (ends == len(data))
+    return starts[keep], ends[keep]
+
+def _find_ascii_runs_loop(arr, min_len):
+    """Loop form of _find_ascii_runs_numpy, compiled with Numba when available"""
+    length = len(arr)
+    starts = np.empty(length // 2 + 2, np.int64)
+    ends = np.empty_like(starts)
+    count = 0
+    i = 0
+    while i < length:
+        if 32 <= arr[i] <= 126:
+            j = i + 1
+            while j < length and 32 <= arr[j] <= 126:
+                j += 1
+            if j - i >= min_len or i == 0 or j == length:
+                starts[count] = i
+                ends[count] = j
+                count += 1
+            i = j
+        else:
+            i += 1
+    return starts[:count], ends[:count]
+
+# Numba is optional: without it the vectorized NumPy version is used
+try:
+    from numba import njit
+    _find_ascii_runs_jit = njit(cache=True)(_find_ascii_runs_loop)
+    
+    def _find_ascii_runs(data: bytes, min_len: int):
+        return _find_ascii_runs_jit(np.frombuffer(data, dtype=np.uint8), min_len)
+except ImportError:
+    _find_ascii_runs = _find_ascii_runs_numpy
+
+def _fadvise(fd: int, offset: int, length: int, advice: str) -> None:
+    """Give the kernel an access-pattern hint where posix_fadvise is supported"""
+    if hasattr(os, 'posix_fadvise') and hasattr(os, advice):
+        try:
+            os.posix_fadvise(fd, offset, length, getattr(os, advice))
+        except OSError:
+            pass
+
+class _AsciiDumpScanner:
+    """Incremental finder of printable ASCII strings, written as 'OFFSET: text' lines"""
+    
+    def __init__(self, out, min_len: int = 4):
+        self.out = out
+        self.min_len = min_len
+        # Printable run left open at the end of the previous chunk
+        self.pending = b''
+        self.pending_start = 0
+    
+    def feed(self, data: bytes, offset: int) -> None:
+        """Process the chunk of the image starting at offset"""
+        # Only strings of min_len+ chars, plus runs touching the chunk edges
+        starts, ends = _find_ascii_runs(data, self.min_len)
+        runs = list(zip(starts.tolist(), ends.tolist()))
+        lines = []
+        
+        # A pending run only continues if this chunk starts printable
+        if self.pending and not (runs and runs[0][0] == 0):
+            if len(self.pending) >= self.min_len:
+                lines.append(b"%08X: %s\n" % (self.pending_start, self.pending))
+            self.pending = b''
+        
+        for start, end in runs:
+            text = data[start:end]
+            string_start = offset + start
+            if start == 0 and self.pending:
+                text = self.pending + text
+                string_start = self.pending_start
+                self.pending = b''
+            
+            # Carry a run that reaches the end of the chunk
+            if end == len(data):
+                self.pending = text
+                self.pending_start = string_start
+            elif len(text) >= self.min_len:
+                lines.append(b"%08X: %s\n" % (string_start, text))
+        
+        self.out.write(b''.join(lines))
+    
+    def finalize(self) -> None:
+        """Flush the string running up to the end of the image"""
+        if len(self.pending) >= self.min_len:
+            self.out.write(b"%08X: %s\n" % (self.pending_start, self.pending))
+        self.pending = b''
+
+class _SignatureScanner:
+    """Incremental signature matcher
+    
+    Signatures are grouped by their 2-byte prefix so each distinct prefix is
+    located once with find() and only the candidates are verified.
+    """
+    
+    def __init__(self, signatures):
+        # Bytes a chunk must extend past its end to verify matches starting in it
+        self.lookahead = max(len(sig) for sig, _ in signatures) - 1
+        self.buckets = {}
+        for order, (sig_bytes, _) in enumerate(signatures):
+            self.buckets.setdefault(sig_bytes[:2], []).append((order, sig_bytes))
+        self.matches = [[] for _ in signatures]
+    
+    def feed(self, data: bytes, offset: int, length: int) -> None:
+        """Record matches starting in data[:length], data starting at offset"""
+        for prefix, entries in self.buckets.items():
+            end = length + len(prefix) - 1
+            pos = data.find(prefix, 0, end)
+            while pos >= 0:
+                for order, sig_bytes in entries:
+                    if len(sig_bytes) == len(prefix) or data.startswith(sig_bytes, pos):
+                        self.matches[order].append(offset + pos)
+                pos = data.find(prefix, pos + 1, end)
+    
+    def finalize(self) -> List[List[int]]:
+        """Return the sorted match offsets of each signature, in signature order"""
+        return self.matches
 
 class RawExtractor:
+    # Common file signatures (searched in this order)
+    FILE_SIGNATURES = (
+        (b'\x4D\x5A', 'DOS Executable (MZ)'),
+        (b'\x50\x4B', 'ZIP Archive'),
+        (b'\x1F\x8B', 'GZIP Archive'),
+        (b'\x42\x5A', 'BZIP2 Archive'),
+        (b'\x89\x50\x4E\x47', 'PNG Image'),
+        (b'\xFF\xD8\xFF', 'JPEG Image'),
+        (b'\x47\x49\x46\x38', 'GIF Image'),
+        (b'\x42\x4D', 'BMP Image'),
+        (b'\x25\x50\x44\x46', 'PDF Document'),
+        (b'\xD0\xCF\x11\xE0', 'MS Office Document'),
+        (b'\x50\x4B\x03\x04', 'ZIP/Office Document'),
+        (b'\x7F\x45\x4C\x46', 'ELF Executable'),
+        (b'\xCA\xFE\xBA\xBE', 'Java Class File'),
+        (b'\xFE\xED\xFA', 'Mach-O Binary'),
+        (b'\x4C\x01', 'MS COFF Object'),
+        (b'\x4D\x53\x44\x4F\x53', 'MS-DOS System'),
+        (b'\x49\x42\x4D', 'IBM Format'),
+        # CP/M specific
+        (b'\xC3', 'CP/M COM file (potential)'),
+        (b'\x31\xC0', 'x86 Assembly start'),
+    )
+    
+    # Longest signature, used as the overlap between search windows
+    MAX_SIGNATURE_LEN = max(len(sig) for sig, _ in FILE_SIGNATURES)
+    
     def __init__(self, image_path: str, verbose: bool = False):
         self.image_path = image_path
         self.verbose = verbose
@@ -20,50 +185,63 @@ class RawExtractor:
         extracted_files = {}
         
         with open(self.image_path, 'rb') as f:
-            # 1. Create hex dump of first sectors
-            hex_file = self._create_hex_dump(f, output_dir)
-            if hex_file:
-                extracted_files["first_sectors.hex"] = hex_file
-            
-            # 2. Extract boot sector
-            boot_file = self._extract_boot_sector(f, output_dir)
-            if boot_file:
-                extracted_files["boot_sector.bin"] = boot_file
-            
-            # 3. Create ASCII dump for text search
-            ascii_file = self._create_ascii_dump(f, output_dir)
-            if ascii_file:
-                extracted_files["ascii_dump.txt"] = ascii_file
+            # The passes below mostly sweep the image front to back; the hex dump
+            # and boot sector read the first 8KB right away
+            _fadvise(f.fileno(), 0, self.file_size, 'POSIX_FADV_SEQUENTIAL')
+            _fadvise(f.fileno(), 0, 8192, 'POSIX_FADV_WILLNEED')
             
-            # 4. Extract sector analysis
-            analysis_file = self._create_sector_analysis(f, output_dir)
-            if analysis_file:
-                extracted_files["sector_analysis.txt"] = analysis_file
-            
-            # 5. Look for potential file signatures
-            signatures_file = self._search_file_signatures(f, output_dir)
-            if signatures_file:
-                extracted_files["file_signatures.txt"] = signatures_file
+            # Map the image once; every pass slices it instead of seeking and reading
+            image = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.file_size else b''
+            try:
+                # 1. Create hex dump of first sectors
+                hex_file = self._create_hex_dump(image, output_dir)
+                if hex_file:
+                    extracted_files["first_sectors.hex"] = hex_file
+                
+                # 2. Extract boot sector
+                boot_file = self._extract_boot_sector(image, output_dir)
+                if boot_file:
+                    extracted_files["boot_sector.bin"] = boot_file
+                
+                # 3. Create ASCII dump for text search; the same sweep over the
+                # image also collects the file signature matches used in step 5
+                ascii_file, signature_matches = self._scan_image(image, output_dir)
+                if ascii_file:
+                    extracted_files["ascii_dump.txt"] = ascii_file
+                
+                # 4. Extract sector analysis
+                analysis_file = self._create_sector_analysis(image, output_dir)
+                if analysis_file:
+                    extracted_files["sector_analysis.txt"] = analysis_file
+                
+                # 5. Look for potential file signatures
+                if signature_matches is not None:
+                    signatures_file = self._search_file_signatures(image, output_dir, signature_matches)
+                    if signatures_file:
+                        extracted_files["file_signatures.txt"] = signatures_file
+            finally:
+                if self.file_size:
+                    image.close()
         
         return extracted_files
     
-    def _create_hex_dump(self, f, output_dir: str) -> Optional[str]:
+    def _create_hex_dump(self, image, output_dir: str) -> Optional[str]:
         """Create hex dump of first 8KB"""
         try:
             hex_file = os.path.join(output_dir, "first_sectors.hex")
             
-            f.seek(0)
-            data = f.read(8192)  # First 8KB
+            data = image[:8192]  # First 8KB
             
             with open(hex_file, 'w') as out:
                 out.write("Hex dump of first 8KB of disk image:\n")
                 out.write("=" * 50 + "\n\n")
                 
+                # Build the ASCII sidebar for the whole block in one pass
+                ascii_all = data.translate(_ASCII_SIDEBAR).decode('ascii')
+                
                 for i in range(0, len(data), 16):
-                    chunk = data[i:i+16]
-                    hex_part = ' '.join(f'{b:02X}' for b in chunk)
-                    ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-                    out.write(f"{i:08X}: {hex_part:<48} |{ascii_part}|\n")
+                    hex_part = data[i:i+16].hex(' ').upper()
+                    out.write(f"{i:08X}: {hex_part:<48} |{ascii_all[i:i+16]}|\n")
             
             return hex_file
         except Exception as e:
@@ -71,13 +249,12 @@ class RawExtractor:
                 print(f"Error creating hex dump: {e}")
             return None
     
-    def _extract_boot_sector(self, f, output_dir: str) -> Optional[str]:
+    def _extract_boot_sector(self, image, output_dir: str) -> Optional[str]:
         """Extract potential boot sector"""
         try:
             boot_file = os.path.join(output_dir, "boot_sector.bin")
             
-            f.seek(0)
-            boot_data = f.read(512)
+            boot_data = image[:512]
             
             if len(boot_data) == 512:
                 with open(boot_file, 'wb') as out:
@@ -88,53 +265,45 @@ class RawExtractor:
                 print(f"Error extracting boot sector: {e}")
         return None
     
-    def _create_ascii_dump(self, f, output_dir: str) -> Optional[str]:
-        """Create ASCII dump for text search"""
+    def _scan_image(self, image, output_dir: str) -> Tuple[Optional[str], Optional[List[List[int]]]]:
+        """Sweep the image once, feeding the ASCII dump and the signature scanner
+        
+        Returns the ASCII dump path and the match offsets of each file signature.
+        """
         try:
             ascii_file = os.path.join(output_dir, "ascii_dump.txt")
             
-            f.seek(0)
-            
-            with open(ascii_file, 'w') as out:
-                out.write("ASCII strings found in disk image:\n")
-                out.write("=" * 40 + "\n\n")
+            # Strings are pure ASCII: write pre-formatted bytes, one batch per chunk
+            with open(ascii_file, 'wb', buffering=1024 * 1024) as out:
+                out.write(b"ASCII strings found in disk image:\n")
+                out.write(b"=" * 40 + b"\n\n")
                 
-                chunk_size = 4096
+                strings = _AsciiDumpScanner(out)
+                signatures = _SignatureScanner(self.FILE_SIGNATURES)
+                
+                chunk_size = 1024 * 1024
                 offset = 0
                 
                 while offset < self.file_size:
-                    f.seek(offset)
-                    data = f.read(chunk_size)
+                    # Read a little past the chunk so signatures crossing its end are verified
+                    data = image[offset:offset + chunk_size + signatures.lookahead]
                     if not data:
                         break
+                    length = min(chunk_size, len(data))
                     
-                    # Extract strings of printable characters
-                    current_string = ""
-                    string_start = 0
-                    
-                    for i, byte in enumerate(data):
-                        if 32 <= byte <= 126:  # Printable ASCII
-                            if not current_string:
-                                string_start = offset + i
-                            current_string += chr(byte)
-                        else:
-                            if len(current_string) >= 4:  # Only strings of 4+ chars
-                                out.write(f"{string_start:08X}: {current_string}\n")
-                            current_string = ""
-                    
-                    # Handle string at end of chunk
-                    if len(current_string) >= 4:
-                        out.write(f"{string_start:08X}: {current_string}\n")
-                    
-                    offset += chunk_size
+                    strings.feed(data[:length] if len(data) > length else data, offset)
+                    signatures.feed(data, offset, length)
+                    offset += length
+                
+                strings.finalize()
             
-            return ascii_file
+            return ascii_file, signatures.finalize()
         except Exception as e:
             if self.verbose:
-                print(f"Error creating ASCII dump: {e}")
-            return None
+                print(f"Error scanning disk image: {e}")
+            return None, None
     
-    def _create_sector_analysis(self, f, output_dir: str) -> Optional[str]:
+    def _create_sector_analysis(self, image, output_dir: str) -> Optional[str]:
         """Analyze sectors for patterns"""
         try:
             analysis_file = os.path.join(output_dir, "sector_analysis.txt")
@@ -146,18 +315,17 @@ class RawExtractor:
                 out.write(f"File size: {self.file_size:,} bytes\n")
                 out.write(f"Potential geometries:\n")
                 
-                # Common sector sizes
+                # Common sector sizes; only geometries that divide the image
+                # evenly into a reasonable track count are formatted
+                lines = []
                 for sector_size in [128, 256, 512, 1024]:
                     sectors = self.file_size // sector_size
-                    out.write(f"  {sector_size} bytes/sector: {sectors} sectors\n")
-                    
-                    # Try common geometries
-                    for heads in [1, 2]:
-                        for spt in [5, 8, 9, 10, 15, 16, 18, 26]:
-                            if sectors % (heads * spt) == 0:
-                                tracks = sectors // (heads * spt)
-                                if tracks <= 100:  # Reasonable track count
-                                    out.write(f"    -> {tracks}C/{heads}H/{spt}S\n")
+                    lines.append(f"  {sector_size} bytes/sector: {sectors} sectors\n")
+                    lines.extend(f"    -> {sectors // (heads * spt)}C/{heads}H/{spt}S\n"
+                                 for heads in [1, 2]
+                                 for spt in [5, 8, 9, 10, 15, 16, 18, 26]
+                                 if sectors % (heads * spt) == 0 and sectors // (heads * spt) <= 100)
+                out.write(''.join(lines))
                 
                 out.write("\nSector Analysis:\n")
                 out.write("-" * 20 + "\n")
@@ -167,12 +335,12 @@ class RawExtractor:
                     out.write(f"\nUsing {sector_size}-byte sectors:\n")
                     
                     for sector_num in range(min(8, self.file_size // sector_size)):
-                        f.seek(sector_num * sector_size)
-                        sector_data = f.read(sector_size)
+                        sector_data = image[sector_num * sector_size:(sector_num + 1) * sector_size]
                         
-                        # Analyze sector content
-                        zero_bytes = sector_data.count(0)
-                        ff_bytes = sector_data.count(0xFF)
+                        # Analyze sector content from a single byte histogram
+                        byte_counts = np.bincount(np.frombuffer(sector_data, dtype=np.uint8), minlength=256)
+                        zero_bytes = int(byte_counts[0])
+                        ff_bytes = int(byte_counts[0xFF])
                         
                         out.write(f"  Sector {sector_num}: ")
                         out.write(f"Zero={zero_bytes} FF={ff_bytes} ")
@@ -187,7 +355,7 @@ class RawExtractor:
                             out.write("[DATA]")
                         
                         # Look for text strings
-                        text_chars = sum(1 for b in sector_data if 32 <= b <= 126)
+                        text_chars = int(byte_counts[32:127].sum())
                         if text_chars > len(sector_data) * 0.3:
                             out.write(" [TEXT?]")
                         
@@ -199,65 +367,36 @@ class RawExtractor:
                 print(f"Error creating sector analysis: {e}")
             return None
     
-    def _search_file_signatures(self, f, output_dir: str) -> Optional[str]:
-        """Search for known file signatures"""
+    def _search_file_signatures(self, image, output_dir: str,
+                                matches: List[List[int]]) -> Optional[str]:
+        """Report known file signatures from the match offsets found by _scan_image"""
         try:
             signatures_file = os.path.join(output_dir, "file_signatures.txt")
             
-            # Common file signatures
-            signatures = {
-                b'\x4D\x5A': 'DOS Executable (MZ)',
-                b'\x50\x4B': 'ZIP Archive',
-                b'\x1F\x8B': 'GZIP Archive', 
-                b'\x42\x5A': 'BZIP2 Archive',
-                b'\x89\x50\x4E\x47': 'PNG Image',
-                b'\xFF\xD8\xFF': 'JPEG Image',
-                b'\x47\x49\x46\x38': 'GIF Image',
-                b'\x42\x4D': 'BMP Image',
-                b'\x25\x50\x44\x46': 'PDF Document',
-                b'\xD0\xCF\x11\xE0': 'MS Office Document',
-                b'\x50\x4B\x03\x04': 'ZIP/Office Document',
-                b'\x7F\x45\x4C\x46': 'ELF Executable',
-                b'\xCA\xFE\xBA\xBE': 'Java Class File',
-                b'\xFE\xED\xFA': 'Mach-O Binary',
-                b'\x4C\x01': 'MS COFF Object',
-                b'\x4D\x53\x44\x4F\x53': 'MS-DOS System',
-                b'\x49\x42\x4D': 'IBM Format',
-                # CP/M specific
-                b'\xC3': 'CP/M COM file (potential)',
-                b'\x31\xC0': 'x86 Assembly start',
-            }
-            
             with open(signatures_file, 'w') as out:
                 out.write("File Signature Search Results\n")
                 out.write("=" * 32 + "\n\n")
                 
-                found_signatures = []
-                
-                # Search through the disk
+                # Report matches per overlapping 4KB window, keeping the
+                # first hit of each signature per window
                 chunk_size = 4096
-                offset = 0
+                step = chunk_size - self.MAX_SIGNATURE_LEN  # Overlap to catch signatures at boundaries
                 
-                while offset < self.file_size:
-                    f.seek(offset)
-                    data = f.read(chunk_size)
-                    if not data:
-                        break
-                    
-                    # Look for signatures
-                    for sig_bytes, description in signatures.items():
-                        pos = data.find(sig_bytes)
-                        if pos != -1:
-                            file_offset = offset + pos
-                            found_signatures.append((file_offset, description, sig_bytes))
-                    
-                    offset += chunk_size - len(max(signatures.keys(), key=len))  # Overlap to catch signatures at boundaries
+                hits = []
+                for order, (sig_bytes, description) in enumerate(self.FILE_SIGNATURES):
+                    for window, file_offset in self._first_hit_per_window(
+                            matches[order], len(sig_bytes), chunk_size, step):
+                        hits.append((window, order, file_offset, description, sig_bytes))
+                
+                hits.sort()
+                found_signatures = [(file_offset, description, sig_bytes)
+                                    for _, _, file_offset, description, sig_bytes in hits]
                 
                 # Write results
                 if found_signatures:
                     out.write("Found file signatures:\n")
                     for file_offset, description, sig_bytes in found_signatures:
-                        hex_sig = ' '.join(f'{b:02X}' for b in sig_bytes)
+                        hex_sig = sig_bytes.hex(' ').upper()
                         out.write(f"  0x{file_offset:08X}: {description} ({hex_sig})\n")
                 else:
                     out.write("No known file signatures found.\n")
@@ -267,9 +406,8 @@ class RawExtractor:
                 out.write("-" * 20 + "\n")
                 
                 # Check for text files
-                f.seek(0)
-                sample = f.read(min(4096, self.file_size))
-                text_chars = sum(1 for b in sample if 32 <= b <= 126 or b in [9, 10, 13])
+                sample = image[:min(4096, self.file_size)]
+                text_chars = sample.translate(_TEXT_MASK).count(1)
                 
                 if text_chars > len(sample) * 0.7:
                     out.write("Disk appears to contain mostly text data\n")
@@ -278,12 +416,11 @@ class RawExtractor:
                 else:
                     out.write("Disk appears to contain mostly binary data\n")
                 
-                # Entropy analysis (simple)
-                byte_counts = [0] * 256
-                for b in sample:
-                    byte_counts[b] += 1
-                
-                unique_bytes = sum(1 for count in byte_counts if count > 0)
+                # Entropy analysis (simple); 4KB is too little for a meaningful
+                # byte histogram, so look at up to the first 64KB
+                entropy_sample = image[:min(65536, self.file_size)]
+                byte_counts = np.bincount(np.frombuffer(entropy_sample, dtype=np.uint8), minlength=256)
+                unique_bytes = int(np.count_nonzero(byte_counts))
                 out.write(f"Byte diversity: {unique_bytes}/256 unique byte values\n")
                 
                 if unique_bytes < 50:
@@ -297,34 +434,74 @@ class RawExtractor:
                 print(f"Error searching file signatures: {e}")
             return None
     
-    def extract_sectors_as_files(self, output_dir: str, sector_size: int = 512) -> Dict[str, str]:
-        """Extract individual sectors as separate files"""
+    @staticmethod
+    def _first_hit_per_window(positions: List[int], sig_len: int, chunk_size: int, step: int):
+        """Yield (window, offset) for the first match in each window
+        
+        Window k covers image[k*step : k*step + chunk_size]; positions are the
+        sorted offsets of every match of a signature sig_len bytes long.
+        """
+        next_window = 0
+        for pos in positions:
+            first = max(next_window, -(-(pos + sig_len - chunk_size) // step))
+            last = pos // step
+            for window in range(first, last + 1):
+                yield window, pos
+            next_window = max(next_window, last + 1)
+    
+    def extract_sectors_as_files(self, output_dir: str, sector_size: int = 512,
+                                 archive: bool = False) -> Dict[str, str]:
+        """Extract individual sectors as separate files
+        
+        With archive=True the sectors are stored as members of a single
+        sectors.tar instead of one small file each.
+        """
         try:
             os.makedirs(output_dir, exist_ok=True)
             
-            sectors_dir = os.path.join(output_dir, "sectors")
-            os.makedirs(sectors_dir, exist_ok=True)
-            
             extracted_files = {}
             num_sectors = self.file_size // sector_size
             
+            sector_limit = min(num_sectors, 100)  # Limit to first 100 sectors
+            
+            # Fetch every sector we may extract with a single read
             with open(self.image_path, 'rb') as f:
-                for sector_num in range(min(num_sectors, 100)):  # Limit to first 100 sectors
-                    f.seek(sector_num * sector_size)
-                    sector_data = f.read(sector_size)
-                    
-                    if len(sector_data) != sector_size:
-                        break
-                    
-                    # Skip empty sectors
-                    if sector_data.count(0) == len(sector_data):
-                        continue
-                    
-                    sector_file = os.path.join(sectors_dir, f"sector_{sector_num:03d}.bin")
+                data = f.read(sector_limit * sector_size)
+            
+            sectors = []
+            for sector_num in range(sector_limit):
+                sector_data = data[sector_num * sector_size:(sector_num + 1) * sector_size]
+                
+                if len(sector_data) != sector_size:
+                    break
+                
+                # Skip empty sectors
+                if sector_data.count(0) == len(sector_data):
+                    continue
+                
+                sectors.append((f"sector_{sector_num:03d}.bin", sector_data))
+            
+            if archive:
+                # One output file instead of up to 100 tiny ones
+                archive_file = os.path.join(output_dir, "sectors.tar")
+                with tarfile.open(archive_file, 'w') as tar:
+                    for name, sector_data in sectors:
+                        info = tarfile.TarInfo(name)
+                        info.size = len(sector_data)
+                        tar.addfile(info, io.BytesIO(sector_data))
+                sector_names = [name for name, _ in sectors]
+                extracted_files["sectors.tar"] = archive_file
+            else:
+                sectors_dir = os.path.join(output_dir, "sectors")
+                os.makedirs(sectors_dir, exist_ok=True)
+                
+                for name, sector_data in sectors:
+                    sector_file = os.path.join(sectors_dir, name)
                     with open(sector_file, 'wb') as sector_out:
                         sector_out.write(sector_data)
                     
-                    extracted_files[f"sector_{sector_num:03d}.bin"] = sector_file
+                    extracted_files[name] = sector_file
+                sector_names = list(extracted_files)
             
             # Create index file
             index_file = os.path.join(output_dir, "sector_index.txt")
@@ -332,10 +509,10 @@ class RawExtractor:
                 out.write(f"Sector extraction from: {os.path.basename(self.image_path)}\n")
                 out.write(f"Sector size: {sector_size} bytes\n")
                 out.write(f"Total sectors: {num_sectors}\n")
-                out.write(f"Extracted sectors: {len(extracted_files)}\n\n")
+                out.write(f"Extracted sectors: {len(sector_names)}\n\n")
                 
                 out.write("Extracted sector files:\n")
-                for filename in sorted(extracted_files.keys()):
+                for filename in sorted(sector_names):
                     out.write(f"  {filename}\n")
             
             extracted_files["sector_index.txt"] = index_file
@@ -354,13 +531,8 @@ class RawExtractor:
             base_name = os.path.splitext(os.path.basename(self.image_path))[0]
             copy_file = os.path.join(output_dir, f"{base_name}_copy.img")
             
-            with open(self.image_path, 'rb') as src:
-                with open(copy_file, 'wb') as dst:
-                    while True:
-                        chunk = src.read(64 * 1024)  # 64KB chunks
-                        if not chunk:
-                            break
-                        dst.write(chunk)
+            # Lets the kernel copy directly between files (sendfile/copy_file_range)
+            shutil.copyfile(self.image_path, copy_file)
             
             return copy_file
         except Exception as e:
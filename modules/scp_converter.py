@@ -7,8 +7,14 @@ con flux) a otros formatos usando un archivo de definición.
 """
 
 import os
+import re
+import asyncio
+import shutil
 import subprocess
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, List, Dict, Any, Tuple
+
+# Bloque de formatos en 'gw convert --help': líneas no vacías tras 'Known formats:'
+_FORMATS_RE = re.compile(r'Known formats:.*\n((?:[^\S\n]*\S.*(?:\n|$))*)')
 
 class SCPConverter:
     """
@@ -27,37 +33,64 @@ class SCPConverter:
         self.progress_callback = progress_callback
         self.error_callback = error_callback
         self.greaseweazle_path = None
+        self._formats_cache = None
         self._find_greaseweazle()
     
-    def _find_greaseweazle(self) -> None:
+    # Ubicaciones donde buscar el ejecutable de Greaseweazle
+    _POSSIBLE_PATHS = (
+        "gw",  # Si está en PATH
+        "/usr/local/bin/gw",
+        "/usr/bin/gw",
+        "/opt/homebrew/bin/gw",
+        "greaseweazle",
+        "/usr/local/bin/greaseweazle",
+        "/usr/bin/greaseweazle",
+        "/opt/homebrew/bin/greaseweazle"
+    )
+    
+    # Ruta encontrada por _locate_greaseweazle; solo se guarda un acierto
+    _located_path: Optional[str] = None
+    
+    @classmethod
+    def _locate_greaseweazle(cls) -> Optional[str]:
         """
-        Busca el ejecutable de Greaseweazle en el sistema.
+        Busca el ejecutable de Greaseweazle, recordando la ruta una vez hallada.
+        
+        Un fallo no se recuerda: la siguiente llamada vuelve a buscar, por si
+        Greaseweazle se ha instalado o montado mientras tanto.
+        
+        Returns:
+            Optional[str]: Ruta del ejecutable, o None si no se encuentra
         """
-        possible_paths = [
-            "gw",  # Si está en PATH
-            "/usr/local/bin/gw",
-            "/usr/bin/gw",
-            "/opt/homebrew/bin/gw",
-            "greaseweazle",
-            "/usr/local/bin/greaseweazle",
-            "/usr/bin/greaseweazle",
-            "/opt/homebrew/bin/greaseweazle"
-        ]
+        if cls._located_path is not None:
+            return cls._located_path
         
-        for path in possible_paths:
+        for path in cls._POSSIBLE_PATHS:
+            # shutil.which descarta rutas inexistentes sin lanzar un proceso
+            if shutil.which(path) is None:
+                continue
             try:
                 result = subprocess.run([path, "--version"], 
                                       capture_output=True, 
                                       text=True, 
                                       timeout=5)
                 if result.returncode == 0:
-                    self.greaseweazle_path = path
-                    self._report_progress(f"Greaseweazle encontrado en: {path}")
-                    return
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+                    cls._located_path = path
+                    return path
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, OSError):
                 continue
         
-        self._report_error("Greaseweazle no encontrado en el sistema")
+        return None
+    
+    def _find_greaseweazle(self) -> None:
+        """
+        Busca el ejecutable de Greaseweazle en el sistema.
+        """
+        self.greaseweazle_path = self._locate_greaseweazle()
+        if self.greaseweazle_path:
+            self._report_progress(f"Greaseweazle encontrado en: {self.greaseweazle_path}")
+        else:
+            self._report_error("Greaseweazle no encontrado en el sistema")
     
     def _report_progress(self, message: str) -> None:
         """Reporta progreso usando el callback si está disponible."""
@@ -91,6 +124,9 @@ class SCPConverter:
         """
         if not self.is_available():
             return []
+        
+        if self._formats_cache is not None:
+            return list(self._formats_cache)
             
         try:
             result = subprocess.run(
@@ -103,19 +139,10 @@ class SCPConverter:
             if result.returncode != 0:
                 return []
                 
-            formats = []
-            in_formats = False
-            for line in result.stdout.split('\n'):
-                if 'Known formats:' in line:
-                    in_formats = True
-                    continue
-                elif in_formats and line.strip():
-                    # Cada línea puede contener varios formatos separados por espacios
-                    formats.extend(line.strip().split())
-                elif in_formats and not line.strip():
-                    break
-                    
-            return formats
+            # Cada línea puede contener varios formatos separados por espacios
+            match = _FORMATS_RE.search(result.stdout)
+            self._formats_cache = match.group(1).split() if match else []
+            return list(self._formats_cache)
         except Exception as e:
             self._report_error(f"Error obteniendo formatos: {e}")
             return []
@@ -189,13 +216,51 @@ class SCPConverter:
         
         return self._execute_convert(cmd, scp_path, output_path)
 
+    def convert_many(self, jobs: List[Tuple[str, str, str]],
+                     max_concurrent: Optional[int] = None) -> List[bool]:
+        """
+        Convierte varios archivos SCP en paralelo.
+        
+        Todas las conversiones comparten un mismo bucle de eventos, de modo que
+        cada proceso de Greaseweazle corre sin necesitar un hilo propio. Un
+        semáforo limita cuántos procesos corren a la vez.
+        
+        Args:
+            jobs: Lista de tuplas (scp_path, format_name, output_path); format_name
+                  puede ser un formato predefinido o la ruta a un archivo DEF
+            max_concurrent: Máximo de conversiones simultáneas (por defecto,
+                            el número de CPUs)
+            
+        Returns:
+            List[bool]: Resultado de cada conversión, en el mismo orden que jobs
+        """
+        if not self.is_available():
+            self._report_error("Greaseweazle no está disponible")
+            return [False] * len(jobs)
+        
+        async def run_all():
+            limit = asyncio.Semaphore(max_concurrent or os.cpu_count() or 1)
+            
+            async def run_one(scp_path: str, format_name: str, output_path: str) -> bool:
+                async with limit:
+                    return await self._execute_convert_async(
+                        [self.greaseweazle_path, "convert", "--format", format_name, scp_path, output_path],
+                        scp_path, output_path)
+            
+            return await asyncio.gather(*[
+                run_one(scp_path, format_name, output_path)
+                for scp_path, format_name, output_path in jobs
+            ])
+        
+        return list(asyncio.run(run_all()))
+
     def _execute_convert(self, cmd: List[str], scp_path: str, output_path: str) -> bool:
         """
-        Convierte un archivo SCP a IMG usando un archivo de definición.
+        Ejecuta un comando de conversión de Greaseweazle.
         
         Args:
+            cmd: Comando completo a ejecutar
             scp_path: Ruta al archivo SCP
-            def_path: Ruta al archivo DEF que define el formato
             output_path: Ruta donde guardar el archivo IMG
             
         Returns:
@@ -205,43 +270,58 @@ class SCPConverter:
             self._report_error("Greaseweazle no está disponible")
             return False
         
-        # Construir comando
-        cmd = [self.greaseweazle_path, "convert"]
-        
-        # Agregar archivo def como formato
-        cmd.extend(["--format", def_path])
-        
-        # Agregar archivos de entrada y salida
-        cmd.extend([scp_path, output_path])
+        return asyncio.run(self._execute_convert_async(cmd, scp_path, output_path))
+
+    async def _execute_convert_async(self, cmd: List[str], scp_path: str, output_path: str) -> bool:
+        """
+        Versión asíncrona de _execute_convert, usada también por convert_many.
         
+        Args:
+            cmd: Comando completo a ejecutar
+            scp_path: Ruta al archivo SCP
+            output_path: Ruta donde guardar el archivo IMG
+            
+        Returns:
+            bool: True si la conversión fue exitosa, False en caso contrario
+        """
         self._report_progress(f"Iniciando conversión de {scp_path} a {output_path}")
-        self._report_progress(f"Usando definición: {def_path}")
         self._report_progress(f"Comando: {' '.join(cmd)}")
         
         try:
             # Ejecutar comando
-            process = subprocess.Popen(cmd, 
-                                     stdout=subprocess.PIPE, 
-                                     stderr=subprocess.PIPE,
-                                     text=True,
-                                     universal_newlines=True)
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE)
             
-            # Leer salida en tiempo real
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    self._report_progress(output.strip())
+            # Leer stderr en paralelo para que el proceso no se bloquee si lo llena
+            stderr_task = asyncio.ensure_future(process.stderr.read())
             
-            # Esperar a que termine
-            return_code = process.wait()
+            try:
+                # Leer salida en tiempo real
+                async for line in process.stdout:
+                    output = line.decode(errors='replace').strip()
+                    if output:
+                        self._report_progress(output)
+                
+                # Esperar a que termine
+                return_code = await process.wait()
+                error_output = (await stderr_task).decode(errors='replace')
+            finally:
+                # Si la lectura falla (p. ej. una línea mayor que el límite
+                # del StreamReader) no dejar el proceso ni la tarea colgados
+                if process.returncode is None:
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                    await process.wait()
+                stderr_task.cancel()
             
             if return_code == 0:
                 self._report_progress("Conversión completada exitosamente")
                 return True
             else:
-                error_output = process.stderr.read()
                 self._report_error(f"Error en la conversión: {error_output}")
                 return False
                 
@@ -7,9 +7,14 @@ This unified module provides all TD0 conversion capabilities in a single file.
 
 import sys
 import os
+import mmap
+import bisect
 import struct
 import time
-from typing import Dict, List, Optional, Tuple, Any, Callable
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple, Any, Callable, Union
 from enum import Enum
 from dataclasses import dataclass, field
 
@@ -47,7 +52,222 @@ d_code_lzss = [
 
 d_len_lzss = [2, 2, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 6, 6, 6, 7]
 
+def _build_initial_tree():
+    """Construye el árbol Huffman adaptativo inicial (parent, son, freq)"""
+    parent = [0] * (TSIZE + N_CHAR)
+    son = [0] * TSIZE
+    freq = [0] * (TSIZE + 1)
+    
+    j = 0
+    for i in range(N_CHAR):
+        freq[i] = 1
+        son[i] = i + TSIZE
+        parent[i + TSIZE] = i
+        
+    i = N_CHAR
+    while i <= ROOT:
+        freq[i] = freq[j] + freq[j + 1]
+        son[i] = j
+        parent[j] = parent[j + 1] = i
+        i += 1
+        j += 2
+        
+    freq[TSIZE] = 0xFFFF
+    parent[ROOT] = 0
+    return tuple(parent), tuple(son), tuple(freq)
+
+# El estado inicial sólo depende de las constantes: se calcula una vez y se copia
+_INIT_PARENT, _INIT_SON, _INIT_FREQ = _build_initial_tree()
+_INIT_RING_BUFF = b'\x20' * (SBSIZE + LASIZE - 1)  # Preset to spaces
+
+# Registros de cabecera TD0 (little-endian). La firma de 2 bytes se lee aparte
+_HEADER_STRUCT = struct.Struct('<8BH')       # Sequence..Sides, CRC
+_COMMENT_STRUCT = struct.Struct('<HH6B')     # CRC, Length, fecha/hora
+_TRACK_STRUCT = struct.Struct('<3B')         # Cylinder, Head, CRC (tras num_sectors)
+_SECTOR_STRUCT = struct.Struct('<6B')        # Cylinder, Head, Sector, Size, Flags, CRC
+_DATA_HEADER_STRUCT = struct.Struct('<HB')   # Size, Encoding
+
+def _lzss_update_freq(parent, son, freq, c):
+    """update_freq de TD0Decompressor sobre arrays, para compilar con Numba"""
+    if freq[ROOT] == MAX_FREQ:
+        # Reconstruir árbol
+        j = 0
+        for i in range(TSIZE):
+            if son[i] >= TSIZE:
+                freq[j] = (freq[i] + 1) // 2
+                son[j] = son[i]
+                j += 1
+                
+        i = 0
+        j = N_CHAR
+        while j < TSIZE:
+            f = freq[i] + freq[i + 1]
+            freq[j] = f
+            k = j
+            while k > 0 and freq[k - 1] > f:
+                k -= 1
+            l = j
+            while l > k:
+                freq[l] = freq[l - 1]
+                son[l] = son[l - 1]
+                l -= 1
+            freq[k] = f
+            son[k] = i
+            i += 2
+            j += 1
+            
+        for i in range(TSIZE):
+            k = son[i]
+            if k >= TSIZE:
+                parent[k] = i
+            else:
+                parent[k] = i
+                parent[k + 1] = i
+                
+    c = parent[c + TSIZE]
+    while c:
+        k = freq[c] + 1
+        freq[c] = k
+        
+        l = c + 1
+        if l < TSIZE + 1 and k > freq[l]:
+            while l < TSIZE + 1 and k > freq[l]:
+                l += 1
+            l -= 1
+            
+            freq[c] = freq[l]
+            freq[l] = k
+            
+            i = son[c]
+            parent[i] = l
+            if i < TSIZE:
+                parent[i + 1] = l
+                
+            j = son[l]
+            parent[j] = c
+            son[l] = i
+            if j < TSIZE:
+                parent[j + 1] = c
+            son[c] = j
+            c = l
+            
+        c = parent[c]
+
+def _lzss_decode_loop(data, parent, son, freq, ring_buff, out, state):
+    """Bucle de TD0Decompressor.decompress como función libre, para Numba.
+    
+    state guarda [input_pos, bits, bitbuff, gb_r, eof, bytes escritos] entre
+    llamadas. Devuelve 0 al llegar a EOF, 1 si out no tiene sitio para otra
+    cadena (el llamador lo amplía y vuelve a llamar) y 2 si se decodifica un
+    símbolo fuera de rango, donde la versión Python lanza IndexError.
+    """
+    pos = state[0]
+    bits = state[1]
+    bitbuff = state[2]
+    r = state[3]
+    eof = state[4]
+    n = state[5]
+    end = len(data)
+    status = 0
+    
+    while not eof:
+        if n + LASIZE > len(out):
+            status = 1
+            break
+            
+        # decode_char
+        c = ROOT
+        while c < TSIZE:
+            if bits == 0:
+                if pos < end:
+                    bitbuff |= int(data[pos]) << 8
+                    pos += 1
+                else:
+                    eof = 1
+                bits = 7
+            else:
+                bits -= 1
+            c = son[c] + (bitbuff >> 15)
+            bitbuff = (bitbuff << 1) & 0xFFFF
+        c -= TSIZE
+        if c >= N_CHAR:
+            status = 2
+            break
+        _lzss_update_freq(parent, son, freq, c)
+        
+        if c < 256:  # Datos directos
+            ring_buff[r] = c
+            r = (r + 1) & (SBSIZE - 1)
+            out[n] = c
+            n += 1
+            continue
+            
+        # decode_position
+        if bits < 8:
+            if pos < end:
+                bitbuff |= int(data[pos]) << (8 - bits)
+                pos += 1
+            else:
+                eof = 1
+        else:
+            bits -= 8
+        i = bitbuff >> 8
+        bitbuff = (bitbuff << 8) & 0xFFFF
+        code = _D_CODE_ARRAY[i] << 6
+        j = _D_LEN_ARRAY[i >> 4] - 1
+        while j > 0:
+            if bits == 0:
+                if pos < end:
+                    bitbuff |= int(data[pos]) << 8
+                    pos += 1
+                else:
+                    eof = 1
+                bits = 7
+            else:
+                bits -= 1
+            i = (i << 1) | (bitbuff >> 15)
+            bitbuff = (bitbuff << 1) & 0xFFFF
+            j -= 1
+            
+        # Cadena comprimida; al llegar a EOF sólo sale el primer byte
+        src = (r - ((i & 0x3F) | code) - 1) & (SBSIZE - 1)
+        length = c - 255 + THRESHOLD
+        if eof:
+            length = 1
+        for k in range(length):
+            b = ring_buff[(src + k) & (SBSIZE - 1)]
+            ring_buff[r] = b
+            r = (r + 1) & (SBSIZE - 1)
+            out[n] = b
+            n += 1
+            
+    state[0] = pos
+    state[1] = bits
+    state[2] = bitbuff
+    state[3] = r
+    state[4] = eof
+    state[5] = n
+    return status
+
+# Numba es opcional: si está instalado el bucle de descompresión se compila
+# a código nativo; sin él se usa la implementación Python de TD0Decompressor
+try:
+    from numba import njit
+    _D_CODE_ARRAY = np.array(d_code_lzss, dtype=np.int64)
+    _D_LEN_ARRAY = np.array(d_len_lzss, dtype=np.int64)
+    _lzss_update_freq = njit(cache=True, boundscheck=False)(_lzss_update_freq)
+    _lzss_decode_jit = njit(cache=True, boundscheck=False)(_lzss_decode_loop)
+except ImportError:
+    _lzss_decode_jit = None
+
 class TD0Decompressor:
+    # Atributos fijos: el bucle de descompresión los lee continuamente y con
+    # __slots__ se acceden por desplazamiento en lugar de buscar en __dict__
+    __slots__ = ('parent', 'son', 'freq', 'bits', 'bitbuff', 'gb_check', 'gb_r',
+                 'gb_i', 'gb_j', 'gb_k', 'gb_state', 'eof', 'ring_buff',
+                 'input_data', 'input_pos', 'input_len', 'decode_lut',
+                 'decode_lut_stamp', 'tree_gen')
+    
     def __init__(self):
         self.parent = [0] * (TSIZE + N_CHAR)
         self.son = [0] * TSIZE
@@ -61,15 +281,22 @@ class TD0Decompressor:
         self.gb_k = 0
         self.gb_state = 0
         self.eof = False
-        self.ring_buff = [0] * (SBSIZE + LASIZE - 1)
+        self.ring_buff = bytearray(SBSIZE + LASIZE - 1)
         self.input_data = None
         self.input_pos = 0
+        self.input_len = 0
+        # Descent results keyed by the next 8 input bits. Each entry is stamped
+        # with the tree generation it was computed for; any change to son[]
+        # bumps tree_gen, which invalidates the whole table in O(1)
+        self.decode_lut = [0] * 256
+        self.decode_lut_stamp = [-1] * 256
+        self.tree_gen = 0
         
     def init_decompress(self):
         """Inicializa el descompresor"""
-        self.parent = [0] * (TSIZE + N_CHAR)
-        self.son = [0] * TSIZE
-        self.freq = [0] * (TSIZE + 1)
+        self.parent = list(_INIT_PARENT)
+        self.son = list(_INIT_SON)
+        self.freq = list(_INIT_FREQ)
         self.bits = 0
         self.bitbuff = 0
         self.gb_check = 0
@@ -79,32 +306,16 @@ class TD0Decompressor:
         self.gb_k = 0
         self.gb_state = 0
         self.eof = False
-        self.ring_buff = [0x20] * (SBSIZE + LASIZE - 1)  # Preset to spaces
-        
-        # Inicializar árboles
-        j = 0
-        for i in range(N_CHAR):
-            self.freq[i] = 1
-            self.son[i] = i + TSIZE
-            self.parent[i + TSIZE] = i
-            
-        i = N_CHAR
-        while i <= ROOT:
-            self.freq[i] = self.freq[j] + self.freq[j + 1]
-            self.son[i] = j
-            self.parent[j] = self.parent[j + 1] = i
-            i += 1
-            j += 2
-            
-        self.freq[TSIZE] = 0xFFFF
-        self.parent[ROOT] = 0
+        self.ring_buff = bytearray(_INIT_RING_BUFF)
+        self.decode_lut_stamp = [-1] * 256
+        self.tree_gen = 0
         self.gb_r = SBSIZE - LASIZE
         
     def get_char(self):
         """Obtiene un byte del flujo de entrada"""
         if self.eof:
             return 0
-        if self.input_pos >= len(self.input_data):
+        if self.input_pos >= self.input_len:
             self.eof = True
             return 0
         c = self.input_data[self.input_pos]
@@ -114,7 +325,12 @@ class TD0Decompressor:
     def get_bit(self):
         """Obtiene un bit del flujo de entrada"""
         if self.bits == 0:
-            self.bitbuff |= self.get_char() << 8
+            # Recargar un byte completo directamente de la entrada (equivale a get_char)
+            if self.input_pos < self.input_len:
+                self.bitbuff |= self.input_data[self.input_pos] << 8
+                self.input_pos += 1
+            else:
+                self.eof = True
             self.bits = 7
         else:
             self.bits -= 1
@@ -126,7 +342,11 @@ class TD0Decompressor:
     def get_byte(self):
         """Obtiene un byte del flujo de entrada (no alineado a bits)"""
         if self.bits < 8:
-            self.bitbuff |= self.get_char() << (8 - self.bits)
+            if self.input_pos < self.input_len:
+                self.bitbuff |= self.input_data[self.input_pos] << (8 - self.bits)
+                self.input_pos += 1
+            else:
+                self.eof = True
         else:
             self.bits -= 8
             
@@ -152,16 +372,13 @@ class TD0Decompressor:
                 k = i + 1
                 f = self.freq[j] = self.freq[i] + self.freq[k]
                 
-                # Encontrar posición correcta
-                k = j - 1
-                while k >= 0 and f < self.freq[k]:
-                    k -= 1
-                k += 1
+                # Encontrar posición correcta (freq[0:j] ya está ordenado;
+                # tras los iguales, como la búsqueda lineal original)
+                k = bisect.bisect_right(self.freq, f, 0, j)
                 
                 # Mover elementos
-                for idx in range(j, k, -1):
-                    self.freq[idx] = self.freq[idx - 1]
-                    self.son[idx] = self.son[idx - 1]
+                self.freq[k + 1:j + 1] = self.freq[k:j]
+                self.son[k + 1:j + 1] = self.son[k:j]
                     
                 self.freq[k] = f
                 self.son[k] = i
@@ -175,7 +392,10 @@ class TD0Decompressor:
                     self.parent[k] = i
                 else:
                     self.parent[k] = self.parent[k + 1] = i
+            
+            self.tree_gen += 1
                     
+        swapped = False
         c = self.parent[c + TSIZE]
         while c:
             k = self.freq[c] + 1
@@ -202,30 +422,111 @@ class TD0Decompressor:
                     self.parent[j + 1] = c
                 self.son[c] = j
                 c = l
+                swapped = True
                 
             c = self.parent[c]
+        
+        if swapped:
+            self.tree_gen += 1
             
     def decode_char(self):
         """Decodifica un carácter del árbol"""
+        # El acumulador de bits vive en locales durante todo el símbolo y se
+        # guarda una sola vez al final (mismo algoritmo que get_bit)
+        son = self.son
+        data = self.input_data
+        pos = self.input_pos
+        end = self.input_len
+        bits = self.bits
+        bitbuff = self.bitbuff
         c = ROOT
+        
+        # Con 8 bits disponibles, resolver hasta 8 niveles del árbol con una
+        # sola consulta a la tabla; sólo se lee un byte si todavía hay entrada,
+        # para no adelantar la detección de EOF
+        if bits < 8 and pos < end:
+            bitbuff |= data[pos] << (8 - bits)
+            pos += 1
+            bits += 8
+        if bits >= 8:
+            prefix = bitbuff >> 8
+            if self.decode_lut_stamp[prefix] == self.tree_gen:
+                entry = self.decode_lut[prefix]
+                c = entry >> 4
+                n = entry & 0xF
+            else:
+                n = 0
+                while c < TSIZE and n < 8:
+                    c = son[c] + ((prefix >> (7 - n)) & 1)
+                    n += 1
+                # Nodo y bits consumidos empaquetados en un int: sin tuplas
+                self.decode_lut[prefix] = (c << 4) | n
+                self.decode_lut_stamp[prefix] = self.tree_gen
+            bitbuff = (bitbuff << n) & 0xFFFF
+            bits -= n
+        
+        # Códigos más largos que 8 bits: seguir bit a bit
         while c < TSIZE:
-            c = self.son[c] + self.get_bit()
+            if bits == 0:
+                if pos < end:
+                    bitbuff |= data[pos] << 8
+                    pos += 1
+                else:
+                    self.eof = True
+                bits = 7
+            else:
+                bits -= 1
+            c = son[c] + (bitbuff >> 15)
+            bitbuff = (bitbuff << 1) & 0xFFFF
             
+        self.input_pos = pos
+        self.bits = bits
+        self.bitbuff = bitbuff
+        
         c -= TSIZE
         self.update_freq(c)
         return c
         
     def decode_position(self):
         """Decodifica una posición comprimida"""
-        i = self.get_byte()
+        data = self.input_data
+        pos = self.input_pos
+        bits = self.bits
+        bitbuff = self.bitbuff
+        
+        # get_byte
+        if bits < 8:
+            if pos < self.input_len:
+                bitbuff |= data[pos] << (8 - bits)
+                pos += 1
+            else:
+                self.eof = True
+        else:
+            bits -= 8
+        i = bitbuff >> 8
+        bitbuff = (bitbuff << 8) & 0xFFFF
         c = d_code_lzss[i] << 6
         
         j = d_len_lzss[i >> 4]
         j -= 1
         while j > 0:
-            i = (i << 1) | self.get_bit()
+            # get_bit
+            if bits == 0:
+                if pos < self.input_len:
+                    bitbuff |= data[pos] << 8
+                    pos += 1
+                else:
+                    self.eof = True
+                bits = 7
+            else:
+                bits -= 1
+            i = (i << 1) | (bitbuff >> 15)
+            bitbuff = (bitbuff << 1) & 0xFFFF
             j -= 1
             
+        self.input_pos = pos
+        self.bits = bits
+        self.bitbuff = bitbuff
         return (i & 0x3F) | c
         
     def lzss_getbyte(self):
@@ -258,22 +559,108 @@ class TD0Decompressor:
                 
             self.gb_state = 0  # Volver a estado no-cadena
             
-    def decompress(self, compressed_data):
-        """Descomprime datos LZSS"""
+    def copy_match(self, src, length, out):
+        """Copia una cadena comprimida del ring buffer a la salida de una vez"""
+        ring_buff = self.ring_buff
+        dst = self.gb_r
+        
+        # Con solapamiento (la cadena repite bytes que ella misma escribe) o
+        # cruzando el final del buffer, copiar byte a byte como lzss_getbyte
+        if (src + length > SBSIZE or dst + length > SBSIZE or
+                0 < ((dst - src) & (SBSIZE - 1)) < length):
+            for k in range(length):
+                c = ring_buff[(src + k) & (SBSIZE - 1)]
+                ring_buff[dst] = c
+                dst = (dst + 1) & (SBSIZE - 1)
+                out.append(c)
+        else:
+            chunk = ring_buff[src:src + length]
+            ring_buff[dst:dst + length] = chunk
+            out += chunk
+            dst = (dst + length) & (SBSIZE - 1)
+            
+        self.gb_r = dst
+        
+    @staticmethod
+    def warmup():
+        """Compila (o carga de la caché de Numba) el bucle de descompresión
+        
+        Sin Numba no hace nada. Si no se llama, la compilación ocurre en la
+        primera descompresión; quien quiera evitar esa espera (p. ej. una GUI
+        al arrancar) puede llamarlo antes, sin cargarlo a cada import.
+        """
+        if _lzss_decode_jit is not None:
+            TD0Decompressor().decompress(b'\x00')
+    
+    def decompress(self, compressed_data, out=None):
+        """Descomprime datos LZSS
+        
+        Si se pasa un bytearray en out, la salida se añade a él y se devuelve
+        ese mismo objeto en lugar de un bytes nuevo.
+        """
         self.input_data = compressed_data
         self.input_pos = 0
+        self.input_len = len(compressed_data)
         self.init_decompress()
         
-        result = []
-        while not self.eof:
-            byte = self.lzss_getbyte()
-            if byte == -1:
-                break
-            result.append(byte)
+        if _lzss_decode_jit is not None:
+            return self._decompress_jit(compressed_data, out)
             
-        return bytes(result)
+        # bytearray guarda un byte por posición y crece de forma geométrica en C
+        result = bytearray() if out is None else out
+        append = result.append
+        ring_buff = self.ring_buff
+        while not self.eof:
+            c = self.decode_char()
+            if c < 256:  # Datos directos
+                ring_buff[self.gb_r] = c
+                self.gb_r = (self.gb_r + 1) & (SBSIZE - 1)
+                append(c)
+                continue
+                
+            # Cadena comprimida: copiarla entera en lugar de byte a byte
+            src = (self.gb_r - self.decode_position() - 1) & (SBSIZE - 1)
+            length = c - 255 + THRESHOLD
+            if self.eof:
+                # Igual que lzss_getbyte: al llegar a EOF sólo sale el primer byte
+                length = 1
+            self.copy_match(src, length, result)
+            
+        return bytes(result) if out is None else out
+        
+    def _decompress_jit(self, compressed_data, out):
+        """decompress con el bucle compilado por Numba"""
+        data = np.frombuffer(compressed_data, dtype=np.uint8)
+        parent = np.array(self.parent, dtype=np.int64)
+        son = np.array(self.son, dtype=np.int64)
+        freq = np.array(self.freq, dtype=np.int64)
+        ring_buff = np.frombuffer(self.ring_buff, dtype=np.uint8).copy()
+        buf = np.empty(max(4 * len(data), 4096), dtype=np.uint8)
+        state = np.array([0, self.bits, self.bitbuff, self.gb_r, 0, 0], dtype=np.int64)
+        
+        status = _lzss_decode_jit(data, parent, son, freq, ring_buff, buf, state)
+        while status == 1:
+            buf = np.concatenate((buf, np.empty(len(buf), dtype=np.uint8)))
+            status = _lzss_decode_jit(data, parent, son, freq, ring_buff, buf, state)
+            
+        # Dejar el objeto en el mismo estado que la versión Python
+        self.input_pos, self.bits, self.bitbuff, self.gb_r = (int(v) for v in state[:4])
+        self.eof = bool(state[4])
+        self.parent = parent.tolist()
+        self.son = son.tolist()
+        self.freq = freq.tolist()
+        self.ring_buff = bytearray(ring_buff)
+        
+        result = bytearray() if out is None else out
+        result += memoryview(buf)[:int(state[5])]
+        if status == 2:
+            # update_freq indexa parent fuera de rango con este símbolo
+            raise IndexError('list index out of range')
+        return bytes(result) if out is None else out
 
 class TD0Reader:
+    __slots__ = ('filename', 'data', 'pos', 'decompressor')
+    
     def __init__(self, filename):
         self.filename = filename
         self.data = None
@@ -281,7 +668,13 @@ class TD0Reader:
         self.decompressor = TD0Decompressor()
         
         with open(filename, 'rb') as f:
-            self.data = f.read()
+            # Mapear el archivo en lugar de leerlo entero: el kernel trae las
+            # páginas bajo demanda. Indexar un mmap devuelve int y cortarlo
+            # devuelve bytes, igual que con el bytes de f.read()
+            if os.fstat(f.fileno()).st_size:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.data = b''
             
     def read_byte(self):
         if self.pos >= len(self.data):
@@ -296,10 +689,28 @@ class TD0Reader:
         return lo | (hi << 8)
         
     def read_bytes(self, count):
-        result = self.data[self.pos:self.pos + count]
+        # self.data pasa a ser un bytearray tras descomprimir; devolver siempre bytes
+        result = bytes(self.data[self.pos:self.pos + count])
         self.pos += count
         return result
         
+    def read_struct(self, record):
+        """Lee un registro de tamaño fijo con un solo unpack.
+        
+        Si el archivo está truncado se comporta como read_byte: los campos
+        que faltan valen 0 y la posición se detiene al final de los datos.
+        """
+        end = self.pos + record.size
+        data_len = len(self.data)
+        if end <= data_len:
+            fields = record.unpack_from(self.data, self.pos)
+            self.pos = end
+        else:
+            tail = bytes(self.data[self.pos:end])
+            fields = record.unpack(tail.ljust(record.size, b'\0'))
+            self.pos = max(self.pos, min(end, data_len))
+        return fields
+        
     def parse_header(self):
         """Parsea el header del archivo TD0"""
         header = {}
@@ -309,22 +720,12 @@ class TD0Reader:
         header['signature'] = signature
         header['compressed'] = signature == b'td'  # 'td' = compressed, 'TD' = normal
         
-        # Sequence, CheckSequence, Version
-        header['sequence'] = self.read_byte()
-        header['check_sequence'] = self.read_byte()
-        header['version'] = self.read_byte()
-        
-        # Data rate, Drive type, Stepping
-        header['data_rate'] = self.read_byte()
-        header['drive_type'] = self.read_byte()
-        header['stepping'] = self.read_byte()
-        
-        # DOS allocation, Sides
-        header['dos_allocation'] = self.read_byte()
-        header['sides'] = self.read_byte()
-        
-        # CRC
-        header['crc'] = self.read_word()
+        # Sequence, CheckSequence, Version, Data rate, Drive type, Stepping,
+        # DOS allocation, Sides, CRC
+        (header['sequence'], header['check_sequence'], header['version'],
+         header['data_rate'], header['drive_type'], header['stepping'],
+         header['dos_allocation'], header['sides'],
+         header['crc']) = self.read_struct(_HEADER_STRUCT)
         
         # Check for comment block
         header['has_comment'] = (header['stepping'] & 0x80) != 0
@@ -336,18 +737,20 @@ class TD0Reader:
         if self.pos >= len(self.data):
             return None
             
-        comment = {}
-        comment['crc'] = self.read_word()
-        comment['length'] = self.read_word()
-        comment['year'] = self.read_byte() + 1900
-        comment['month'] = self.read_byte()
-        comment['day'] = self.read_byte()
-        comment['hour'] = self.read_byte()
-        comment['minute'] = self.read_byte()
-        comment['second'] = self.read_byte()
+        crc, length, year, month, day, hour, minute, second = self.read_struct(_COMMENT_STRUCT)
+        comment = {
+            'crc': crc,
+            'length': length,
+            'year': year + 1900,
+            'month': month,
+            'day': day,
+            'hour': hour,
+            'minute': minute,
+            'second': second,
+        }
         
         # Leer datos del comentario
-        comment['data'] = self.read_bytes(comment['length'])
+        comment['data'] = self.read_bytes(length)
         
         return comment
         
@@ -363,9 +766,7 @@ class TD0Reader:
         if track['num_sectors'] == 255:
             return None
             
-        track['cylinder'] = self.read_byte()
-        track['head'] = self.read_byte()
-        track['crc'] = self.read_byte()
+        track['cylinder'], track['head'], track['crc'] = self.read_struct(_TRACK_STRUCT)
         
         return track
         
@@ -374,18 +775,19 @@ class TD0Reader:
         if self.pos >= len(self.data):
             return None
             
-        sector = {}
-        sector['cylinder'] = self.read_byte()
-        sector['head'] = self.read_byte()
-        sector['sector_num'] = self.read_byte()
-        sector['size_code'] = self.read_byte()
-        sector['flags'] = self.read_byte()
-        sector['crc'] = self.read_byte()
-        
-        # Calcular tamaño real del sector
-        size_table = [128, 256, 512, 1024, 2048, 4096, 8192, 16384]
-        if sector['size_code'] < len(size_table):
-            sector['size'] = size_table[sector['size_code']]
+        cylinder, head, sector_num, size_code, flags, crc = self.read_struct(_SECTOR_STRUCT)
+        sector = {
+            'cylinder': cylinder,
+            'head': head,
+            'sector_num': sector_num,
+            'size_code': size_code,
+            'flags': flags,
+            'crc': crc,
+        }
+        
+        # Calcular tamaño real del sector: 128 << size_code (128..16384)
+        if size_code < 8:
+            sector['size'] = 128 << size_code
         else:
             sector['size'] = 256  # Default para HP150
             
@@ -393,6 +795,17 @@ class TD0Reader:
         
     def parse_sector_data(self, sector):
         """Parsea los datos de un sector"""
+        payload = self.read_sector_payload(sector)
+        if payload is None:
+            return None
+        return decode_sector_payload(payload)
+        
+    def read_sector_payload(self, sector):
+        """Lee los datos de un sector sin decodificarlos
+        
+        Devuelve (encoding, datos, tamaño del sector) o None si el sector no
+        tiene datos; decode_sector_payload hace la decodificación.
+        """
         if self.pos >= len(self.data):
             return None
             
@@ -400,24 +813,14 @@ class TD0Reader:
         if sector['flags'] & 0x30:  # Bits 4 o 5 set = no data
             return None
             
-        data_header = {}
-        data_header['size'] = self.read_word()
-        data_header['encoding'] = self.read_byte()
+        size, encoding = self.read_struct(_DATA_HEADER_STRUCT)
         
         # Leer datos según encoding
-        raw_data = self.read_bytes(data_header['size'] - 1)
-        
-        # Decodificar según método
-        if data_header['encoding'] == 0:  # Raw data
-            return raw_data
-        elif data_header['encoding'] == 1:  # Repeated pattern
-            return self.decode_pattern(raw_data, sector['size'])
-        elif data_header['encoding'] == 2:  # RLE
-            return self.decode_rle(raw_data, sector['size'])
-        else:
-            return raw_data
+        raw_data = self.read_bytes(size - 1)
+        return encoding, raw_data, sector['size']
             
-    def decode_pattern(self, data, sector_size):
+    @staticmethod
+    def decode_pattern(data, sector_size):
         """Decodifica patrón repetido"""
         result = bytearray()
         pos = 0
@@ -430,57 +833,72 @@ class TD0Reader:
             pattern = data[pos+2:pos+4]
             pos += 4
             
-            for _ in range(count):
-                result.extend(pattern)
-                if len(result) >= sector_size:
-                    break
+            # Repetir el patrón de una vez, sin pasarse del tamaño del sector
+            remaining = sector_size - len(result)
+            result.extend(bytes(pattern) * min(count, (remaining + 1) // 2))
                     
         return bytes(result[:sector_size])
         
-    def decode_rle(self, data, sector_size):
+    @staticmethod
+    def decode_rle(data, sector_size):
         """Decodifica RLE"""
         result = bytearray()
         pos = 0
+        data_len = len(data)
         
-        while len(result) < sector_size and pos < len(data):
-            if pos >= len(data):
-                break
-                
+        while len(result) < sector_size and pos < data_len:
             length = data[pos]
             pos += 1
             
             if length == 0:  # Literal block
-                if pos >= len(data):
+                if pos >= data_len:
                     break
                 literal_len = data[pos]
                 pos += 1
+                end = pos + literal_len
                 
-                if pos + literal_len > len(data):
+                if end > data_len:
                     break
                     
-                result.extend(data[pos:pos+literal_len])
-                pos += literal_len
+                result.extend(data[pos:end])
+                pos = end
             else:  # Repeated block
-                if pos >= len(data):
+                if pos >= data_len:
                     break
                     
                 repeat_count = data[pos]
                 pos += 1
-                block_len = length * 2
+                end = pos + length * 2
                 
-                if pos + block_len > len(data):
+                if end > data_len:
                     break
                     
-                block = data[pos:pos+block_len]
-                pos += block_len
+                block = bytes(data[pos:end])
+                pos = end
                 
-                for _ in range(repeat_count):
-                    result.extend(block)
-                    if len(result) >= sector_size:
-                        break
+                # Repetir el bloque de una vez, sin pasarse del tamaño del sector
+                remaining = sector_size - len(result)
+                result.extend(block * min(repeat_count, -(-remaining // len(block))))
                         
         return bytes(result[:sector_size])
 
+def decode_sector_payload(payload):
+    """Decodifica un (encoding, datos, tamaño) leído por read_sector_payload
+    
+    Es una función de módulo para poder enviarla a un ProcessPoolExecutor.
+    """
+    encoding, raw_data, sector_size = payload
+    
+    # Decodificar según método
+    if encoding == 0:  # Raw data
+        return raw_data
+    elif encoding == 1:  # Repeated pattern
+        return TD0Reader.decode_pattern(raw_data, sector_size)
+    elif encoding == 2:  # RLE
+        return TD0Reader.decode_rle(raw_data, sector_size)
+    else:
+        return raw_data
+
 class SectorType(Enum):
     NORMAL = 0
     PHANTOM = 1
@@ -488,6 +906,9 @@ class SectorType(Enum):
     REPEATED = 3
     AKAI_SPECIAL = 4
 
+# Sector types that never have a data block after their header
+_DATALESS_SECTOR_TYPES = frozenset((SectorType.PHANTOM, SectorType.AKAI_SPECIAL))
+
 class DebugLevel(Enum):
     NONE = 0
     HEADERS = 1
@@ -495,7 +916,7 @@ class DebugLevel(Enum):
     BLOCKS = 3
     VERBOSE = 4
 
-@dataclass
+@dataclass(slots=True)
 class ConversionOptions:
     """Options for TD0 conversion"""
     debug_level: DebugLevel = DebugLevel.NONE
@@ -504,8 +925,9 @@ class ConversionOptions:
     fix_boot_sector: bool = True
     verbose: bool = False
     generate_def: bool = False
+    parallel: bool = False  # Decode sector data in a process pool
 
-@dataclass
+@dataclass(slots=True)
 class ConversionStats:
     """Statistics from conversion process"""
     sectors_read: int = 0
@@ -518,7 +940,7 @@ class ConversionStats:
     image_size: int = 0
     conversion_time: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class GeometryInfo:
     """Detected disk geometry information"""
     type: str = "unknown"
@@ -530,7 +952,15 @@ class GeometryInfo:
     sector_counts: Dict[Tuple[int, int], int] = field(default_factory=dict)
     sector_sizes: Dict[int, int] = field(default_factory=dict)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class OutputGeometry:
+    """Geometry of the generated image"""
+    cylinders: int
+    heads: int
+    sectors_per_track: int
+    bytes_per_sector: int
+
+@dataclass(slots=True)
 class ConversionResult:
     """Result of conversion process"""
     success: bool = False
@@ -550,30 +980,46 @@ class ConversionCallbacks:
         self.on_error: Optional[Callable[[str], None]] = None
         self.on_info: Optional[Callable[[str], None]] = None
 
+# crcmod is optional: when installed its C implementation computes the
+# CRC-16/ARC (poly 0xA001 reflected, init 0) used by wteledsk
+try:
+    import crcmod.predefined
+    _crc16_arc = crcmod.predefined.mkCrcFun('crc-16')
+except ImportError:
+    _crc16_arc = None
+
+def _build_crc16_table() -> Tuple[int, ...]:
+    """Generate CRC-16 table"""
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+# Built once at import instead of for every CRCCalculator
+_CRC16_ARC_TABLE = _build_crc16_table()
+
 class CRCCalculator:
     """CRC calculation similar to wteledsk"""
     
-    def __init__(self):
-        self.crc_table = self._generate_crc_table()
+    __slots__ = ()
     
-    def _generate_crc_table(self) -> List[int]:
-        """Generate CRC-16 table"""
-        table = []
-        for i in range(256):
-            crc = i
-            for _ in range(8):
-                if crc & 1:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
-            table.append(crc)
-        return table
+    crc_table = _CRC16_ARC_TABLE
     
     def calculate_crc(self, data: bytes) -> int:
         """Calculate CRC-16 for data"""
+        if _crc16_arc is not None:
+            return _crc16_arc(data)
+        
         crc = 0
+        tbl = _CRC16_ARC_TABLE
         for byte in data:
-            crc = (crc >> 8) ^ self.crc_table[(crc ^ byte) & 0xFF]
+            crc = (crc >> 8) ^ tbl[(crc ^ byte) & 0xFF]
         return crc & 0xFFFF
     
     def verify_header_crc(self, header_data: bytes, expected_crc: int) -> bool:
@@ -594,6 +1040,144 @@ class CRCCalculator:
 # Import the geometry detector
 from .geometry_detector import GeometryDetectorLegacy
 
+# Boot sector signature 55 AA at offset 254, read and written as one word
+_BOOT_SIGNATURE_STRUCT = struct.Struct('<H')
+_BOOT_SIGNATURE = 0xAA55
+_BOOT_SIGNATURE_OFFSET = 254
+
+@contextmanager
+def _mapped_image_file(path: str, size: int, fill: Optional[int] = 0xFF):
+    """Create path with size bytes of fill and yield it as a writable mmap
+    
+    Sectors are copied straight into the file's pages, so the image is never
+    held in a separate buffer; the mapping is flushed and closed on exit.
+    With fill=None the image is left as ftruncate made it: all zeros.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    completed = False
+    try:
+        os.ftruncate(fd, size)
+        if not size:
+            # mmap refuses empty mappings: hand out a buffer instead and
+            # write whatever the caller put in it
+            image = bytearray()
+            yield image
+            view = memoryview(image)
+            while view:
+                view = view[os.write(fd, view):]
+            completed = True
+            return
+        image = mmap.mmap(fd, size)
+        try:
+            # Tracks are placed in LBA order: advise sequential access where
+            # the platform supports it (madvise is Python 3.8+, not Windows)
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                image.madvise(mmap.MADV_SEQUENTIAL)
+            if fill is not None:
+                np.frombuffer(image, dtype=np.uint8).fill(fill)
+            yield image
+            image.flush()
+            completed = True
+        finally:
+            image.close()
+    finally:
+        os.close(fd)
+        if not completed:
+            # Leave no truncated or half-built image behind
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+# Largest TD0 sector (size code 7) worth of 0xFF; short sectors are padded by
+# copying a zero-copy slice of it into the image instead of building new bytes
+_FF_PADDING = memoryview(b'\xff' * 16384)
+
+def _pad_ff(view: memoryview, start: int, end: int) -> None:
+    """Set view[start:end] to 0xFF without allocating"""
+    length = end - start
+    if length <= len(_FF_PADDING):
+        view[start:end] = _FF_PADDING[:length]
+    else:
+        np.frombuffer(view, dtype=np.uint8)[start:end] = 0xFF
+
+def _fill_image(image: Union[bytearray, mmap.mmap], tracks: List[Dict[str, Any]], total_sectors: int,
+                heads: int, spt: int, bps: int) -> Tuple[int, int]:
+    """Copy track sectors into a 0xFF-filled image, returning (written, missing)
+    
+    Only the sectors present in each track are visited; sectors are
+    truncated or padded with 0xFF to bps bytes.
+    """
+    # Released on the way out, even on error, so the mmap behind it can close
+    with memoryview(image) as view:
+        sectors_written = 0
+        sectors_missing = 0
+        
+        for track in tracks:
+            first = (track['cylinder'] * heads + track['head']) * spt
+            if first >= total_sectors:
+                continue
+            
+            base = first * bps
+            present = 0
+            for sector_num, sector_data in track['sectors'].items():
+                if sector_num >= spt or sector_data is None:
+                    continue
+                
+                offset = base + sector_num * bps
+                n = min(len(sector_data), bps)
+                view[offset:offset + n] = memoryview(sector_data)[:n]
+                if n < bps:
+                    # The slot may hold an earlier copy of this track: re-pad it
+                    _pad_ff(view, offset + n, offset + bps)
+                present += 1
+            
+            sectors_written += present
+            sectors_missing += spt - present
+    
+    return sectors_written, sectors_missing
+
+def _fill_image_hp150(image: Union[bytearray, mmap.mmap], tracks: List[Dict[str, Any]], total_sectors: int,
+                      heads: int) -> Tuple[int, int]:
+    """_fill_image for the HP150 geometry: 16 sectors of 256 bytes as literals"""
+    # Released on the way out, even on error, so the mmap behind it can close
+    with memoryview(image) as view:
+        sectors_written = 0
+        sectors_missing = 0
+        
+        for track in tracks:
+            first = (track['cylinder'] * heads + track['head']) << 4
+            if first >= total_sectors:
+                continue
+            
+            base = first << 8
+            present = 0
+            for sector_num, sector_data in track['sectors'].items():
+                if sector_num >= 16 or sector_data is None:
+                    continue
+                
+                offset = base + (sector_num << 8)
+                if len(sector_data) >= 256:
+                    view[offset:offset + 256] = memoryview(sector_data)[:256]
+                else:
+                    n = len(sector_data)
+                    view[offset:offset + n] = sector_data
+                    view[offset + n:offset + 256] = _FF_PADDING[:256 - n]
+                present += 1
+            
+            sectors_written += present
+            sectors_missing += 16 - present
+    
+    return sectors_written, sectors_missing
+
+def _decode_payloads_parallel(payloads: List[Tuple[int, bytes, int]]) -> List[bytes]:
+    """Decode sector payloads across CPU cores, preserving order"""
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(decode_sector_payload, payloads, chunksize=64))
+
+# Printable ASCII stays, everything else becomes '.' in sector dumps
+_DUMP_ASCII_TABLE = bytes(c if 32 <= c <= 126 else 46 for c in range(256))
+
 class EnhancedTD0Reader(TD0Reader):
     """Enhanced TD0 Reader with wteledsk-like features"""
     
@@ -604,10 +1188,13 @@ class EnhancedTD0Reader(TD0Reader):
         self.crc_calc = CRCCalculator()
         self.geometry_detector = GeometryDetectorLegacy()
         self.stats = ConversionStats()
+        # Nivel numérico cacheado: los parsers por sector lo comparan antes de
+        # formatear mensajes que en el nivel NONE se descartarían
+        self._debug_level = options.debug_level.value
     
     def log_debug(self, level: DebugLevel, message: str):
         """Debug logging"""
-        if self.options.debug_level.value >= level.value:
+        if self._debug_level >= level.value:
             if self.callbacks.on_debug:
                 self.callbacks.on_debug(level, message)
     
@@ -634,7 +1221,7 @@ class EnhancedTD0Reader(TD0Reader):
         header = self.parse_header()
         
         # Verify header CRC
-        if self.options.debug_level.value >= DebugLevel.HEADERS.value:
+        if self._debug_level >= DebugLevel.HEADERS.value:
             header_bytes = self.data[:10]  # First 10 bytes
             if not self.crc_calc.verify_header_crc(header_bytes, header['crc']):
                 self.log_warning("Header CRC verification failed")
@@ -660,15 +1247,18 @@ class EnhancedTD0Reader(TD0Reader):
         if track is None:
             return None
         
+        # Sin debug no hay CRC que verificar ni mensajes que formatear
+        if self._debug_level < DebugLevel.HEADERS.value:
+            return track
+        
         # Verify track CRC
-        if self.options.debug_level.value >= DebugLevel.HEADERS.value:
-            track_pos = self.pos - 4  # Go back to track header
-            track_bytes = self.data[track_pos:track_pos + 3]
-            if not self.crc_calc.verify_track_crc(track_bytes, track['crc']):
-                self.log_warning(f"Track CRC verification failed for track {track['cylinder']}")
-                self.stats.crc_errors += 1
-            else:
-                self.log_debug(DebugLevel.HEADERS, f"Track {track['cylinder']} CRC verified ✓")
+        track_pos = self.pos - 4  # Go back to track header
+        track_bytes = self.data[track_pos:track_pos + 3]
+        if not self.crc_calc.verify_track_crc(track_bytes, track['crc']):
+            self.log_warning(f"Track CRC verification failed for track {track['cylinder']}")
+            self.stats.crc_errors += 1
+        else:
+            self.log_debug(DebugLevel.HEADERS, f"Track {track['cylinder']} CRC verified ✓")
         
         self.log_debug(DebugLevel.HEADERS, 
                       f"Track {track['cylinder']}, Head {track['head']}, Sectors: {track['num_sectors']}")
@@ -702,30 +1292,42 @@ class EnhancedTD0Reader(TD0Reader):
         # Classify sector
         sector_type = self.classify_sector(sector)
         sector['type'] = sector_type
+        debug = self._debug_level >= DebugLevel.SECTORS.value
         
         # Handle special sectors
         if sector_type == SectorType.PHANTOM:
-            self.log_debug(DebugLevel.SECTORS, f"Phantom sector 0x{sector['sector_num']:02X}")
+            if debug:
+                self.log_debug(DebugLevel.SECTORS, f"Phantom sector 0x{sector['sector_num']:02X}")
             self.stats.phantom_sectors += 1
             return sector
         
         if sector_type == SectorType.AKAI_SPECIAL:
-            self.log_debug(DebugLevel.SECTORS, "AKAI termination sector (0x65)")
+            if debug:
+                self.log_debug(DebugLevel.SECTORS, "AKAI termination sector (0x65)")
             return sector
         
         if sector_type == SectorType.SKIPPED:
-            self.log_debug(DebugLevel.SECTORS, f"Skipped sector {sector['sector_num']}")
+            if debug:
+                self.log_debug(DebugLevel.SECTORS, f"Skipped sector {sector['sector_num']}")
             self.stats.sectors_skipped += 1
             return sector
         
-        self.log_debug(DebugLevel.SECTORS, f"Normal sector {sector['sector_num']} (size: {sector['size']})")
+        if debug:
+            self.log_debug(DebugLevel.SECTORS, f"Normal sector {sector['sector_num']} (size: {sector['size']})")
         self.stats.sectors_read += 1
         
         return sector
     
+    def read_sector_payload_enhanced(self, sector: Dict[str, Any]) -> Optional[Tuple[int, bytes, int]]:
+        """Read undecoded sector data, skipping phantom and AKAI END sectors"""
+        if sector['type'] in _DATALESS_SECTOR_TYPES:
+            return None
+        
+        return self.read_sector_payload(sector)
+    
     def parse_sector_data_enhanced(self, sector: Dict[str, Any]) -> Optional[bytes]:
         """Enhanced sector data parsing with CRC verification"""
-        if sector['type'] in [SectorType.PHANTOM, SectorType.AKAI_SPECIAL]:
+        if sector['type'] in _DATALESS_SECTOR_TYPES:
             return None
         
         sector_data = self.parse_sector_data(sector)
@@ -733,14 +1335,14 @@ class EnhancedTD0Reader(TD0Reader):
             return None
         
         # Verify sector data CRC if available
-        if self.options.debug_level.value >= DebugLevel.SECTORS.value and sector['crc'] != 0:
+        if self._debug_level >= DebugLevel.SECTORS.value and sector['crc'] != 0:
             if not self.crc_calc.verify_sector_crc(sector_data, sector['crc']):
                 self.log_warning(f"Sector {sector['sector_num']} CRC verification failed")
                 self.stats.crc_errors += 1
             else:
                 self.log_debug(DebugLevel.SECTORS, f"Sector {sector['sector_num']} CRC verified ✓")
         
-        if self.options.debug_level.value >= DebugLevel.BLOCKS.value:
+        if self._debug_level >= DebugLevel.BLOCKS.value:
             self.dump_sector_data(sector_data, sector['sector_num'])
         
         return sector_data
@@ -750,8 +1352,9 @@ class EnhancedTD0Reader(TD0Reader):
         dump_lines = []
         dump_lines.append(f"--- Sector {sector_num} Data ({len(data)} bytes) ---")
         for i in range(0, min(len(data), 256), 16):
-            hex_part = ' '.join(f"{b:02x}" for b in data[i:i+16])
-            ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in data[i:i+16])
+            line = bytes(data[i:i+16])
+            hex_part = line.hex(' ')
+            ascii_part = line.translate(_DUMP_ASCII_TABLE).decode('ascii')
             dump_lines.append(f"{i:04x}: {hex_part:<48} {ascii_part}")
         
         self.log_debug(DebugLevel.BLOCKS, "\n".join(dump_lines))
@@ -806,7 +1409,7 @@ class TD0Converter:
         start_time = time.time()
         
         try:
-            self._log_info(f"Converting {input_file} to {output_file}...")
+            self._log_info(lambda: f"Converting {input_file} to {output_file}...")
             
             # Initialize reader
             self.reader = EnhancedTD0Reader(input_file, self.options, self.callbacks)
@@ -819,19 +1422,25 @@ class TD0Converter:
                 self._log_info("Decompressing TD0 file...")
                 self.reader.log_debug(DebugLevel.VERBOSE, "Starting decompression...")
                 compressed_data = self.reader.data[self.reader.pos:]
-                decompressed = self.reader.decompressor.decompress(compressed_data)
-                self.reader.data = self.reader.data[:self.reader.pos] + decompressed
-                self.reader.log_debug(DebugLevel.VERBOSE, f"Decompressed {len(compressed_data)} -> {len(decompressed)} bytes")
+                # Decompress straight after the header instead of concatenating copies
+                data = bytearray(self.reader.data[:self.reader.pos])
+                self.reader.decompressor.decompress(compressed_data, data)
+                self.reader.data = data
+                self.reader.log_debug(DebugLevel.VERBOSE, f"Decompressed {len(compressed_data)} -> {len(data) - self.reader.pos} bytes")
             
             # Parse comment
             if header['has_comment']:
                 comment = self.reader.parse_comment()
                 if comment:
-                    self._log_info(f"Comment: {comment['data'].decode('latin-1', errors='replace')}")
+                    self._log_info(lambda: f"Comment: {comment['data'].decode('latin-1', errors='replace')}")
             
             # Parse all tracks
             self.tracks = self._parse_all_tracks()
             
+            # The sector data has been copied out of the file buffer (the
+            # decompressed copy for compressed images): let it go
+            self.reader.data = b''
+            
             # Detect geometry
             self.geometry = self.reader.geometry_detector.detect_geometry(self.tracks)
             result.geometry = self.geometry
@@ -843,6 +1452,12 @@ class TD0Converter:
                 result.error_message = "Failed to generate image"
                 return result
             
+            # The image is on disk; only the counts are needed from here on,
+            # so drop the sector data before the .def generation
+            track_count = len(self.tracks)
+            sector_count = sum(len(track['sectors']) for track in self.tracks)
+            self.tracks = []
+            
             # Generate .def file if requested
             if self.options.generate_def:
                 def_filename = self._get_def_filename(output_file)
@@ -856,7 +1471,7 @@ class TD0Converter:
                     sectors_per_track=self.geometry.get('sectors_per_track', 16),
                     bytes_per_sector=self.geometry.get('bytes_per_sector', 256),
                     has_phantom=self.geometry.get('has_phantom', False),
-                    total_sectors=sum(len(track['sectors']) for track in self.tracks),
+                    total_sectors=sector_count,
                     file_size=0,  # Will be set by generator
                     source_format="td0",
                     sector_counts=self.geometry.get('sector_counts', {}),
@@ -883,7 +1498,7 @@ class TD0Converter:
             # Finalize stats
             result.stats = self.reader.stats
             result.stats.conversion_time = time.time() - start_time
-            result.stats.tracks_processed = len(self.tracks)
+            result.stats.tracks_processed = track_count
             result.success = True
             
             return result
@@ -904,60 +1519,103 @@ class TD0Converter:
         tracks = []
         track_num = 0
         
+        # In parallel mode sector data is only read here and decoded in a
+        # process pool afterwards. Per-sector CRC checks and dumps need the
+        # decoded data in order, so debug levels from SECTORS up stay serial.
+        parallel = (self.options.parallel and
+                    self.options.debug_level.value < DebugLevel.SECTORS.value)
+        pending = []
+        
+        # Bound once: the loop below runs for every sector in the file
+        reader = self.reader
+        parse_track = reader.parse_track_enhanced
+        parse_sector = reader.parse_sector_enhanced
+        parse_data = (reader.read_sector_payload_enhanced if parallel
+                      else reader.parse_sector_data_enhanced)
+        handle_seq = reader.handle_sector_sequence_errors
+        warn_only = self.options.warn_only
+        on_progress = self.callbacks.on_progress
+        # Progress is reported every 8 tracks or 50 ms, whichever comes first
+        last_progress = time.monotonic()
+        reported_track = 0
+        NORMAL = SectorType.NORMAL
+        PHANTOM = SectorType.PHANTOM
+        AKAI_SPECIAL = SectorType.AKAI_SPECIAL
+        
         while True:
-            track = self.reader.parse_track_enhanced()
+            track = parse_track()
             if track is None:
                 break
             
+            sectors = {}
             track_data = {
                 'cylinder': track['cylinder'],
                 'head': track['head'],
                 'num_sectors': track['num_sectors'],
-                'sectors': {}
+                'sectors': sectors
             }
             
             # Parse sectors for this track
             expected_sector = 0
             
             for i in range(track['num_sectors']):
-                sector = self.reader.parse_sector_enhanced()
+                sector = parse_sector()
                 if sector is None:
                     break
                 
-                # Handle sector sequence
-                if sector['type'] == SectorType.NORMAL:
-                    success, error_info = self.reader.handle_sector_sequence_errors(
-                        expected_sector, sector['sector_num'], track_num
-                    )
+                sector_type = sector['type']
+                sector_num = sector['sector_num']
+                
+                # Handle sector sequence (only a mismatch can fail)
+                if sector_type is NORMAL and sector_num != expected_sector:
+                    success, error_info = handle_seq(expected_sector, sector_num, track_num)
                     
-                    if not success and not self.options.warn_only:
-                        self.reader.log_error(f"Stopping due to sector sequence error")
+                    if not success and not warn_only:
+                        reader.log_error(f"Stopping due to sector sequence error")
                         break
                 
-                # Parse sector data
-                sector_data = self.reader.parse_sector_data_enhanced(sector)
-                
-                # Handle special sectors
-                if sector['type'] == SectorType.AKAI_SPECIAL:
-                    self.reader.log_debug(DebugLevel.VERBOSE, "Early termination due to AKAI END sector")
+                # Handle special sectors; they carry no data to parse
+                if sector_type is AKAI_SPECIAL:
+                    reader.log_debug(DebugLevel.VERBOSE, "Early termination due to AKAI END sector")
                     break
                 
-                if sector['type'] == SectorType.PHANTOM:
-                    self.reader.log_debug(DebugLevel.SECTORS, f"Ignoring phantom sector 0x{sector['sector_num']:02X}")
+                if sector_type is PHANTOM:
+                    reader.log_debug(DebugLevel.SECTORS, f"Ignoring phantom sector 0x{sector_num:02X}")
                     continue
                 
+                # Parse sector data
+                sector_data = parse_data(sector)
+                
                 # Store sector data
-                track_data['sectors'][sector['sector_num']] = sector_data
+                sectors[sector_num] = sector_data
+                if parallel and sector_data is not None:
+                    pending.append((sectors, sector_num, sector_data))
                 
-                if sector['type'] == SectorType.NORMAL:
-                    expected_sector = sector['sector_num'] + 1
+                if sector_type is NORMAL:
+                    expected_sector = sector_num + 1
             
             tracks.append(track_data)
             track_num += 1
             
             # Progress callback
-            if self.callbacks.on_progress:
-                self.callbacks.on_progress(f"Processing track {track_num}", track_num, -1)
+            if on_progress:
+                now = time.monotonic()
+                if track_num % 8 == 0 or now - last_progress > 0.05:
+                    on_progress(f"Processing track {track_num}", track_num, -1)
+                    last_progress = now
+                    reported_track = track_num
+        
+        # Always report the last track
+        if on_progress and reported_track != track_num:
+            on_progress(f"Processing track {track_num}", track_num, -1)
+        
+        if pending:
+            # A repeated sector may have replaced the payload since it was
+            # queued; only swap in decoded data where the payload is still held
+            decoded = _decode_payloads_parallel([payload for _, _, payload in pending])
+            for (sectors, sector_num, payload), sector_data in zip(pending, decoded):
+                if sectors[sector_num] is payload:
+                    sectors[sector_num] = sector_data
         
         return tracks
     
@@ -965,76 +1623,55 @@ class TD0Converter:
         """Generate HP150 image with flexible geometry"""
         try:
             # Determine output geometry
+            geometry = self.geometry
             if self.options.force_hp150:
                 # Force HP150 standard geometry
-                output_geometry = {
-                    'sectors_per_track': 16,
-                    'bytes_per_sector': 256,
-                    'cylinders': self.geometry['cylinders'],
-                    'heads': self.geometry['heads']
-                }
+                output_geometry = OutputGeometry(
+                    cylinders=geometry['cylinders'],
+                    heads=geometry['heads'],
+                    sectors_per_track=16,
+                    bytes_per_sector=256
+                )
             else:
                 # Use detected geometry
-                output_geometry = {
-                    'sectors_per_track': self.geometry['sectors_per_track'],
-                    'bytes_per_sector': self.geometry['bytes_per_sector'],
-                    'cylinders': self.geometry['cylinders'],
-                    'heads': self.geometry['heads']
-                }
-            
-            # Calculate image size
-            total_sectors = (output_geometry['cylinders'] * 
-                           output_geometry['heads'] * 
-                           output_geometry['sectors_per_track'])
-            image_size = total_sectors * output_geometry['bytes_per_sector']
-            
-            self._log_info(f"Output geometry: {output_geometry['sectors_per_track']} sectors/track, {output_geometry['bytes_per_sector']} bytes/sector")
-            self._log_info(f"Image size: {image_size} bytes ({image_size/1024:.1f} KB)")
-            
-            # Create image
-            image = bytearray(b'\xff' * image_size)
-            
-            # Fill image with track data
-            sectors_written = 0
-            sectors_missing = 0
-            
-            for track in self.tracks:
-                for sector_num in range(output_geometry['sectors_per_track']):
-                    # Calculate sector position
-                    track_offset = ((track['cylinder'] * output_geometry['heads'] + track['head']) * 
-                                  output_geometry['sectors_per_track'])
-                    sector_offset = (track_offset + sector_num) * output_geometry['bytes_per_sector']
-                    
-                    if sector_offset + output_geometry['bytes_per_sector'] > len(image):
-                        continue
-                    
-                    # Get sector data
-                    sector_data = track['sectors'].get(sector_num)
-                    
-                    if sector_data is not None:
-                        # Adjust sector data size
-                        if len(sector_data) > output_geometry['bytes_per_sector']:
-                            sector_data = sector_data[:output_geometry['bytes_per_sector']]
-                        elif len(sector_data) < output_geometry['bytes_per_sector']:
-                            sector_data += b'\xff' * (output_geometry['bytes_per_sector'] - len(sector_data))
-                        
-                        # Write sector
-                        image[sector_offset:sector_offset + output_geometry['bytes_per_sector']] = sector_data
-                        sectors_written += 1
-                    else:
-                        sectors_missing += 1
+                output_geometry = OutputGeometry(
+                    cylinders=geometry['cylinders'],
+                    heads=geometry['heads'],
+                    sectors_per_track=geometry['sectors_per_track'],
+                    bytes_per_sector=geometry['bytes_per_sector']
+                )
             
-            # Apply HP150 corrections
-            if self.options.fix_boot_sector:
-                self._fix_boot_sector(image)
+            spt = output_geometry.sectors_per_track
+            bps = output_geometry.bytes_per_sector
+            heads = output_geometry.heads
             
-            # Write image
-            with open(output_file, 'wb') as f:
-                f.write(image)
+            # Calculate image size
+            total_sectors = output_geometry.cylinders * heads * spt
+            image_size = total_sectors * bps
+            
+            self._log_info(lambda: f"Output geometry: {spt} sectors/track, {bps} bytes/sector")
+            self._log_info(lambda: f"Image size: {image_size} bytes ({image_size/1024:.1f} KB)")
+            
+            # Build the image directly in the output file through a memory
+            # map: sectors land in the file's pages, with no whole-image
+            # bytearray alongside them
+            with _mapped_image_file(output_file, image_size) as image:
+                # Fill image with track data; the HP150 16 x 256 layout has its
+                # own copy of the loop with the geometry folded into constants
+                if spt == 16 and bps == 256:
+                    sectors_written, sectors_missing = _fill_image_hp150(
+                        image, self.tracks, total_sectors, heads)
+                else:
+                    sectors_written, sectors_missing = _fill_image(
+                        image, self.tracks, total_sectors, heads, spt, bps)
+                
+                # Apply HP150 corrections
+                if self.options.fix_boot_sector:
+                    self._fix_boot_sector(image)
             
-            self._log_info(f"Image created: {output_file}")
-            self._log_info(f"Sectors written: {sectors_written}")
-            self._log_info(f"Sectors missing: {sectors_missing}")
+            self._log_info(lambda: f"Image created: {output_file}")
+            self._log_info(lambda: f"Sectors written: {sectors_written}")
+            self._log_info(lambda: f"Sectors missing: {sectors_missing}")
             
             # Update stats
             self.reader.stats.image_size = image_size
@@ -1045,26 +1682,23 @@ class TD0Converter:
             self.reader.log_error(f"Image generation failed: {e}")
             return False
     
-    def _fix_boot_sector(self, image: bytearray):
+    def _fix_boot_sector(self, image: Union[bytearray, mmap.mmap]):
         """Fix HP150 boot sector"""
         if len(image) < 256:
             return
         
         self._log_info("Checking and fixing boot sector...")
         
-        # Check and fix boot signature
-        boot_signature = image[254:256]
-        if boot_signature != b'\x55\xaa':
-            self._log_info(f"Boot signature: {boot_signature.hex()} -> Fixed to 55AA")
-            image[254] = 0x55
-            image[255] = 0xaa
+        # Check and fix boot signature as a single word, in place
+        if _BOOT_SIGNATURE_STRUCT.unpack_from(image, _BOOT_SIGNATURE_OFFSET)[0] != _BOOT_SIGNATURE:
+            self._log_info(lambda: f"Boot signature: {image[254:256].hex()} -> Fixed to 55AA")
+            _BOOT_SIGNATURE_STRUCT.pack_into(image, _BOOT_SIGNATURE_OFFSET, _BOOT_SIGNATURE)
         else:
             self._log_info("Boot signature correct")
         
         # Check OEM ID
-        oem_id = image[3:11]
-        if oem_id != b'HP150   ':
-            self._log_info(f"OEM ID: {repr(oem_id)} (keeping as-is)")
+        if image.find(b'HP150   ', 3, 11) != 3:
+            self._log_info(lambda: f"OEM ID: {repr(bytearray(image[3:11]))} (keeping as-is)")
         else:
             self._log_info("OEM ID correct: HP150")
     
@@ -1090,10 +1724,15 @@ class TD0Converter:
         
         return command
     
-    def _log_info(self, message: str):
-        """Log info message"""
-        if self.callbacks.on_info:
-            self.callbacks.on_info(message)
+    def _log_info(self, message: Union[str, Callable[[], str]]):
+        """Log info message
+        
+        message may be a callable returning the text, so that formatting is
+        skipped entirely when no on_info callback is registered.
+        """
+        on_info = self.callbacks.on_info
+        if on_info:
+            on_info(message() if callable(message) else message)
 
 # Convenience functions for simple usage
 def convert_td0_to_hp150(input_file: str, output_file: str, 
@@ -1150,6 +1789,7 @@ class FixedTD0Converter:
         self.reader = None
         self.geometry = None
         self.tracks = []
+        self.total_sectors = 0
     
     def convert(self, input_file: str, output_file: str) -> ConversionResult:
         """Main conversion method - versión mejorada"""
@@ -1171,9 +1811,11 @@ class FixedTD0Converter:
                 self._log_info("Decompressing TD0 file...")
                 self.reader.log_debug(DebugLevel.VERBOSE, "Starting decompression...")
                 compressed_data = self.reader.data[self.reader.pos:]
-                decompressed = self.reader.decompressor.decompress(compressed_data)
-                self.reader.data = self.reader.data[:self.reader.pos] + decompressed
-                self.reader.log_debug(DebugLevel.VERBOSE, f"Decompressed {len(compressed_data)} -> {len(decompressed)} bytes")
+                # Decompress straight after the header instead of concatenating copies
+                data = bytearray(self.reader.data[:self.reader.pos])
+                self.reader.decompressor.decompress(compressed_data, data)
+                self.reader.data = data
+                self.reader.log_debug(DebugLevel.VERBOSE, f"Decompressed {len(compressed_data)} -> {len(data) - self.reader.pos} bytes")
             
             # Parse comment
             if header['has_comment']:
@@ -1215,7 +1857,7 @@ class FixedTD0Converter:
                     sectors_per_track=self.geometry.get('sectors_per_track', 16),
                     bytes_per_sector=self.geometry.get('bytes_per_sector', 256),
                     has_phantom=self.geometry.get('has_phantom', False),
-                    total_sectors=sum(len(track['sectors']) for track in self.tracks),
+                    total_sectors=self.total_sectors,
                     file_size=img_file_size,
                     source_format="td0",
                     sector_counts=self.geometry.get('sector_counts', {}),
@@ -1265,98 +1907,27 @@ class FixedTD0Converter:
             
             return result
     
-    def _parse_all_tracks_fixed(self) -> List[Dict[str, Any]]:
-        """Parse all tracks con manejo mejorado de errores - NUNCA se detiene"""
-        tracks = []
-        track_num = 0
-        
-        while True:
-            track = self.reader.parse_track_enhanced()
-            if track is None:
-                break
-            
-            track_data = {
-                'cylinder': track['cylinder'],
-                'head': track['head'],
-                'num_sectors': track['num_sectors'],
-                'sectors': {}
-            }
-            
-            # Parse sectors for this track
-            expected_sector = 0
-            sectors_processed = 0
-            
-            for i in range(track['num_sectors']):
-                sector = self.reader.parse_sector_enhanced()
-                if sector is None:
-                    break
-                
-                # Handle sector sequence - SIEMPRE continuar
-                if sector['type'] == SectorType.NORMAL:
-                    # Solo reportar, no usar para expected_sector logic
-                    if expected_sector != sector['sector_num']:
-                        success, error_info = self.reader.handle_sector_sequence_errors(
-                            expected_sector, sector['sector_num'], track_num
-                        )
-                    # IGNORAR el resultado 'success' - siempre continuar
-                
-                # Parse sector data
-                sector_data = self.reader.parse_sector_data_enhanced(sector)
-                
-                # Handle special sectors
-                if sector['type'] == SectorType.AKAI_SPECIAL:
-                    self.reader.log_debug(DebugLevel.VERBOSE, "Early termination due to AKAI END sector")
-                    break
-                
-                if sector['type'] == SectorType.PHANTOM:
-                    self.reader.log_debug(DebugLevel.SECTORS, f"Ignoring phantom sector 0x{sector['sector_num']:02X}")
-                    continue
-                
-                # Store sector data incluso si hay errores de secuencia
-                if sector_data is not None:
-                    track_data['sectors'][sector['sector_num']] = sector_data
-                
-                if sector['type'] == SectorType.NORMAL:
-                    expected_sector = sector['sector_num'] + 1
-                
-                sectors_processed += 1
-            
-            # Agregar track incluso si tuvo errores
-            tracks.append(track_data)
-            track_num += 1
-            
-            # Progress callback
-            if self.callbacks.on_progress:
-                self.callbacks.on_progress(f"Processing track {track_num}", track_num, -1)
-        
-        return tracks
-    
     def _generate_image_fixed(self, output_file: str) -> bool:
         """Generate disk image respecting original geometry"""
         try:
             # Always use detected geometry - no forcing
-            output_geometry = {
-                'sectors_per_track': self.geometry['sectors_per_track'],
-                'bytes_per_sector': self.geometry['bytes_per_sector'],
-                'cylinders': self.geometry['cylinders'],
-                'heads': self.geometry['heads']
-            }
+            geometry = self.geometry
+            sectors_per_track = geometry['sectors_per_track']
+            bytes_per_sector = geometry['bytes_per_sector']
+            cylinders = geometry['cylinders']
+            heads = geometry['heads']
             
             # Calculate image size
-            total_sectors = (output_geometry['cylinders'] * 
-                           output_geometry['heads'] * 
-                           output_geometry['sectors_per_track'])
-            image_size = total_sectors * output_geometry['bytes_per_sector']
+            total_sectors = cylinders * heads * sectors_per_track
+            image_size = total_sectors * bytes_per_sector
             
-            self._log_info(f"Output geometry: {output_geometry['sectors_per_track']} sectors/track, {output_geometry['bytes_per_sector']} bytes/sector")
+            self._log_info(f"Output geometry: {sectors_per_track} sectors/track, {bytes_per_sector} bytes/sector")
             self._log_info(f"Image size: {image_size} bytes ({image_size/1024:.1f} KB)")
             
-            # Create image filled with zeros for better compatibility
-            image = bytearray(b'\x00' * image_size)
-            
             # Fill image with track data - improved handling
             sectors_written = 0
             sectors_missing = 0
+            tracks_seen = 0
             
             # Create mapping of all available sectors
             sector_map = {}
@@ -1364,7 +1935,8 @@ class FixedTD0Converter:
                 track_key = (track['cylinder'], track['head'])
                 sector_map[track_key] = track['sectors']
             
-            # First, find and extract boot sector from first track
+            # First, find and extract boot sector from first track. It is
+            # kept as a bytes_per_sector buffer that goes to position 0
             boot_sector_data = None
             first_track_sectors = sector_map.get((0, 0), {})
             
@@ -1375,12 +1947,10 @@ class FixedTD0Converter:
                     self._log_info(f"Boot sector found in sector 1, size: {len(sector_data)} bytes")
                     
                     # Use sector 1 as boot sector (place at position 0)
-                    copy_size = min(len(sector_data), output_geometry['bytes_per_sector'])
-                    image[0:copy_size] = sector_data[:copy_size]
-                    if copy_size < output_geometry['bytes_per_sector']:
-                        image[copy_size:output_geometry['bytes_per_sector']] = b'\x00' * (output_geometry['bytes_per_sector'] - copy_size)
+                    copy_size = min(len(sector_data), bytes_per_sector)
+                    boot_sector_data = bytearray(bytes_per_sector)
+                    boot_sector_data[0:copy_size] = sector_data[:copy_size]
                     
-                    boot_sector_data = sector_data
                     self._log_info("Boot sector (from sector 1) placed at position 0")
             
             # Fallback: look for boot sector in sector 0
@@ -1388,63 +1958,66 @@ class FixedTD0Converter:
                 sector_data = first_track_sectors[0]
                 if sector_data and (b'MSDOS' in sector_data or b'FAT' in sector_data):
                     self._log_info(f"Boot sector found in sector 0, size: {len(sector_data)} bytes")
-                    boot_sector_data = bytearray(output_geometry['bytes_per_sector'])
+                    boot_sector_data = bytearray(bytes_per_sector)
                     
                     if len(sector_data) >= 3 and sector_data[:3] == b'\xeb\x3c\x90':
-                        copy_size = min(len(sector_data), output_geometry['bytes_per_sector'])
+                        copy_size = min(len(sector_data), bytes_per_sector)
                         boot_sector_data[:copy_size] = sector_data[:copy_size]
                     else:
                         boot_sector_data[0:3] = b'\xeb\x3c\x90'
-                        copy_size = min(len(sector_data), output_geometry['bytes_per_sector'] - 3)
+                        copy_size = min(len(sector_data), bytes_per_sector - 3)
                         boot_sector_data[3:3+copy_size] = sector_data[:copy_size]
                         self._log_info("Added missing jump instruction to boot sector")
                     
-                    image[0:output_geometry['bytes_per_sector']] = boot_sector_data
                     self._log_info("Boot sector placed at position 0")
             
-            # Fill image sector by sector
+            # Build the image in the output file through a memory map. The
+            # file is sized with ftruncate, so it already reads as zeros (for
+            # better compatibility) and only the sectors we have are copied
             boot_sector_found = boot_sector_data is not None
+            track_size = sectors_per_track * bytes_per_sector
             
-            for cylinder in range(output_geometry['cylinders']):
-                for head in range(output_geometry['heads']):
-                    track_key = (cylinder, head)
-                    track_sectors = sector_map.get(track_key, {})
+            with _mapped_image_file(output_file, image_size, fill=None) as image:
+                if boot_sector_found:
+                    image[0:bytes_per_sector] = boot_sector_data
+                
+                # Walk the tracks the TD0 has instead of probing the map for
+                # every (cylinder, head); absent tracks are all missing
+                for (cylinder, head), track_sectors in sector_map.items():
+                    if not (0 <= cylinder < cylinders and 0 <= head < heads):
+                        continue
                     
-                    for sector_num in range(output_geometry['sectors_per_track']):
-                        track_offset = ((cylinder * output_geometry['heads'] + head) * 
-                                      output_geometry['sectors_per_track'])
-                        sector_offset = (track_offset + sector_num) * output_geometry['bytes_per_sector']
-                        
-                        if sector_offset + output_geometry['bytes_per_sector'] > len(image):
-                            continue
-                        
-                        # Skip sector 0 of first track if we already handled boot sector
-                        if sector_num == 0 and cylinder == 0 and head == 0 and boot_sector_found:
-                            sectors_written += 1
+                    # Sector 0 of first track holds the boot sector if we found one
+                    boot_track = (boot_sector_found and sectors_per_track > 0 and
+                                  cylinder == 0 and head == 0)
+                    present = 1 if boot_track else 0
+                    
+                    # Visit only the sectors the track has. TD0 numbers
+                    # them from 1, so sector n goes to slot n - 1
+                    track_offset = (cylinder * heads + head) * track_size
+                    for lookup_sector_num, sector_data in track_sectors.items():
+                        sector_num = lookup_sector_num - 1
+                        if (sector_data is None or not 0 <= sector_num < sectors_per_track or
+                                (boot_track and sector_num == 0)):
                             continue
                         
-                        # Handle sector mapping for TD0 that starts at sector 1
-                        lookup_sector_num = sector_num + 1
-                        sector_data = track_sectors.get(lookup_sector_num)
-                        
-                        if sector_data is not None:
-                            if len(sector_data) > output_geometry['bytes_per_sector']:
-                                sector_data = sector_data[:output_geometry['bytes_per_sector']]
-                            elif len(sector_data) < output_geometry['bytes_per_sector']:
-                                sector_data += b'\x00' * (output_geometry['bytes_per_sector'] - len(sector_data))
-                            
-                            image[sector_offset:sector_offset + output_geometry['bytes_per_sector']] = sector_data
-                            sectors_written += 1
-                        else:
-                            sectors_missing += 1
-            
-            # Apply corrections
-            if self.options.fix_boot_sector:
-                self._fix_boot_sector_fixed(image)
-            
-            # Write image
-            with open(output_file, 'wb') as f:
-                f.write(image)
+                        # Short sectors need no padding, the image is
+                        # already zero; long ones are cut through a view
+                        if len(sector_data) > bytes_per_sector:
+                            sector_data = memoryview(sector_data)[:bytes_per_sector]
+                        sector_offset = track_offset + sector_num * bytes_per_sector
+                        image[sector_offset:sector_offset + len(sector_data)] = sector_data
+                        present += 1
+                    
+                    tracks_seen += 1
+                    sectors_written += present
+                    sectors_missing += sectors_per_track - present
+                
+                sectors_missing += (cylinders * heads - tracks_seen) * sectors_per_track
+                
+                # Apply corrections
+                if self.options.fix_boot_sector:
+                    self._fix_boot_sector_fixed(image)
             
             self._log_info(f"Image created: {output_file}")
             self._log_info(f"Sectors written: {sectors_written}")
@@ -1461,17 +2034,32 @@ class FixedTD0Converter:
         """Parse all tracks con manejo mejorado de errores - NUNCA se detiene"""
         tracks = []
         track_num = 0
+        # Sectores con datos, contados por pista al terminarla
+        self.total_sectors = 0
+        
+        # Enlazados una sola vez: el bucle se ejecuta para cada sector
+        reader = self.reader
+        parse_track = reader.parse_track_enhanced
+        parse_sector = reader.parse_sector_enhanced
+        parse_data = reader.parse_sector_data_enhanced
+        handle_seq = reader.handle_sector_sequence_errors
+        log_debug = reader.log_debug
+        on_progress = self.callbacks.on_progress
+        NORMAL = SectorType.NORMAL
+        PHANTOM = SectorType.PHANTOM
+        AKAI_SPECIAL = SectorType.AKAI_SPECIAL
         
         while True:
-            track = self.reader.parse_track_enhanced()
+            track = parse_track()
             if track is None:
                 break
             
+            sectors = {}
             track_data = {
                 'cylinder': track['cylinder'],
                 'head': track['head'],
                 'num_sectors': track['num_sectors'],
-                'sectors': {}
+                'sectors': sectors
             }
             
             # Parse sectors for this track
@@ -1479,51 +2067,53 @@ class FixedTD0Converter:
             sectors_processed = 0
             
             for i in range(track['num_sectors']):
-                sector = self.reader.parse_sector_enhanced()
+                sector = parse_sector()
                 if sector is None:
                     break
                 
+                sector_type = sector['type']
+                sector_num = sector['sector_num']
+                
                 # Handle sector sequence - SIEMPRE continuar
-                if sector['type'] == SectorType.NORMAL:
+                if sector_type is NORMAL:
                     # Solo reportar, no usar para expected_sector logic
-                    if expected_sector != sector['sector_num']:
-                        success, error_info = self.reader.handle_sector_sequence_errors(
-                            expected_sector, sector['sector_num'], track_num
-                        )
+                    if expected_sector != sector_num:
+                        success, error_info = handle_seq(expected_sector, sector_num, track_num)
                     # IGNORAR el resultado 'success' - siempre continuar
                 
                 # Parse sector data
-                sector_data = self.reader.parse_sector_data_enhanced(sector)
+                sector_data = parse_data(sector)
                 
                 # Handle special sectors
-                if sector['type'] == SectorType.AKAI_SPECIAL:
-                    self.reader.log_debug(DebugLevel.VERBOSE, "Early termination due to AKAI END sector")
+                if sector_type is AKAI_SPECIAL:
+                    log_debug(DebugLevel.VERBOSE, "Early termination due to AKAI END sector")
                     break
                 
-                if sector['type'] == SectorType.PHANTOM:
-                    self.reader.log_debug(DebugLevel.SECTORS, f"Ignoring phantom sector 0x{sector['sector_num']:02X}")
+                if sector_type is PHANTOM:
+                    log_debug(DebugLevel.SECTORS, f"Ignoring phantom sector 0x{sector_num:02X}")
                     continue
                 
                 # Store sector data incluso si hay errores de secuencia
                 if sector_data is not None:
-                    track_data['sectors'][sector['sector_num']] = sector_data
+                    sectors[sector_num] = sector_data
                 
-                if sector['type'] == SectorType.NORMAL:
-                    expected_sector = sector['sector_num'] + 1
+                if sector_type is NORMAL:
+                    expected_sector = sector_num + 1
                 
                 sectors_processed += 1
             
             # Agregar track incluso si tuvo errores
             tracks.append(track_data)
+            self.total_sectors += len(sectors)
             track_num += 1
             
             # Progress callback
-            if self.callbacks.on_progress:
-                self.callbacks.on_progress(f"Processing track {track_num}", track_num, -1)
+            if on_progress:
+                on_progress(f"Processing track {track_num}", track_num, -1)
         
         return tracks
     
-    def _fix_boot_sector_fixed(self, image: bytearray):
+    def _fix_boot_sector_fixed(self, image: Union[bytearray, mmap.mmap]):
         """Fix HP150 boot sector - enhanced version"""
         if len(image) < 256:
             return
@@ -1531,16 +2121,14 @@ class FixedTD0Converter:
         self._log_info("Checking and fixing boot sector...")
         
         # Check and fix boot signature
-        boot_signature = image[254:256]
-        if boot_signature != b'\x55\xaa':
-            self._log_info(f"Boot signature: {boot_signature.hex()} -> Fixed to 55AA")
-            image[254] = 0x55
-            image[255] = 0xaa
+        if _BOOT_SIGNATURE_STRUCT.unpack_from(image, _BOOT_SIGNATURE_OFFSET)[0] != _BOOT_SIGNATURE:
+            self._log_info(f"Boot signature: {image[254:256].hex()} -> Fixed to 55AA")
+            _BOOT_SIGNATURE_STRUCT.pack_into(image, _BOOT_SIGNATURE_OFFSET, _BOOT_SIGNATURE)
         else:
             self._log_info("Boot signature correct")
         
-        # Check OEM ID
-        oem_id = image[3:11]
+        # Check OEM ID (as a bytearray whether image is one or an mmap)
+        oem_id = bytearray(image[3:11])
         if oem_id != b'HP150   ':
             self._log_info(f"OEM ID: {repr(oem_id)} (keeping as-is)")
         else:
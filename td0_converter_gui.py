@@ -3,7 +3,7 @@ from tkinter import filedialog, messagebox
 import os
 import subprocess
 from modules.fat_lister import FATHandler
-from modules.td0_converter_lib import FixedTD0Converter, ConversionOptions
+from modules.td0_converter_lib import FixedTD0Converter, ConversionOptions, TD0Decompressor
 from modules.geometry_detector import GeometryDetector
 from modules.def_generator import DefGenerator, DefGenerationOptions
 
@@ -335,6 +335,8 @@ Disk Geometry:
         self.root.title(f"TD0/IMG File Manager - {os.path.basename(scp_path)}")
 
 def run_gui():
+    # Compile the TD0 decoder in the background so the first conversion doesn't wait for it
+    threading.Thread(target=TD0Decompressor.warmup, daemon=True).start()
     root = tk.Tk()
     app = TD0ImageGUI(root)
     root.mainloop()
@@ -11,7 +11,7 @@ import threading
 import tempfile
 import subprocess
 from modules.auto_converter import EnhancedGenericDiskHandler
-from modules.td0_converter_lib import FixedTD0Converter, ConversionOptions, ConversionResult
+from modules.td0_converter_lib import FixedTD0Converter, ConversionOptions, ConversionResult, TD0Decompressor
 from modules.geometry_detector import GeometryDetector
 from modules.def_generator import DefGenerator, DefGenerationOptions
 from modules.greaseweazle_writer import GreaseweazleWriter
@@ -1406,6 +1406,8 @@ Disk Geometry:
         self.root.destroy()
 
 def main():
+    # Compile the TD0 decoder in the background so the first conversion doesn't wait for it
+    threading.Thread(target=TD0Decompressor.warmup, daemon=True).start()
     root = tk.Tk()
     app = TD0ImageGUI(root)
     root.mainloop()
@@ -18,7 +18,7 @@ import time
 sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
 
 from modules.auto_converter import EnhancedGenericDiskHandler
-from modules.td0_converter_lib import FixedTD0Converter, ConversionOptions
+from modules.td0_converter_lib import FixedTD0Converter, ConversionOptions, TD0Decompressor
 from modules.geometry_detector import GeometryDetector
 from modules.def_generator import DefGenerator, DefGenerationOptions
 from modules.imd_handler import IMD2IMGConverter
@@ -444,6 +444,8 @@ def session_status(session_id):
 
 # Cleanup thread
 start_cleanup_thread()
+# Compile the TD0 decoder in the background so the first conversion doesn't wait for it
+threading.Thread(target=TD0Decompressor.warmup, daemon=True).start()
 
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
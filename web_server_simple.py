@@ -20,7 +20,7 @@ from werkzeug.utils import secure_filename
 sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
 
 from modules.auto_converter import EnhancedGenericDiskHandler
-from modules.td0_converter_lib import FixedTD0Converter, ConversionOptions
+from modules.td0_converter_lib import FixedTD0Converter, ConversionOptions, TD0Decompressor
 from modules.geometry_detector import GeometryDetector
 from modules.def_generator import DefGenerator, DefGenerationOptions
 from modules.imd_handler import IMD2IMGConverter
@@ -398,6 +398,8 @@ def extract_files(operation_id):
 
 # Start cleanup thread
 start_cleanup_thread()
+# Compile the TD0 decoder in the background so the first conversion doesn't wait for it
+threading.Thread(target=TD0Decompressor.warmup, daemon=True).start()
 
 if __name__ == '__main__':
     # Create required directories